@@ -0,0 +1,211 @@
+# Lista Doblemente Enlazada sobre arreglos (struct-of-arrays)
+# En vez de un objeto Nodo por elemento, los datos y los enlaces viven en
+# tres arreglos paralelos: datos[i], siguientes[i] y anteriores[i]. Los enlaces
+# son índices (VACIO = sin vecino), así no hay ciclos de objetos que el
+# recolector de basura tenga que revisar. Las casillas liberadas se
+# encadenan en una lista de libres y se reutilizan en la siguiente inserción.
+
+from array import array
+
+from Comun import mostrar, repr_acotado, visibles_doble
+
+VACIO = -1             # Índice que hace de None en los enlaces
+
+
+class ArrayDoublyLinkedList:
+    def __init__(self):
+        self.datos = []
+        self.siguientes = array("q")
+        self.anteriores = array("q")
+        self.head = VACIO
+        self.tail = VACIO
+        self.libre = VACIO      # Primera casilla libre (encadenadas por siguientes)
+        self.length = 0
+
+    # Crear una lista a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable):
+        lista = cls()
+        lista.extend(iterable)
+        return lista
+
+    # Casilla para un dato nuevo: reutiliza una libre o agranda los arreglos
+    def _nueva_casilla(self, data, anterior, siguiente):
+        casilla = self.libre
+        if casilla == VACIO:
+            casilla = len(self.datos)
+            self.datos.append(data)
+            self.siguientes.append(siguiente)
+            self.anteriores.append(anterior)
+        else:
+            self.libre = self.siguientes[casilla]
+            self.datos[casilla] = data
+            self.siguientes[casilla] = siguiente
+            self.anteriores[casilla] = anterior
+        self.length += 1
+        return casilla
+
+    # Liberar una casilla (sin dejar vivo su dato)
+    def _liberar(self, casilla):
+        dato = self.datos[casilla]
+        self.datos[casilla] = None
+        self.anteriores[casilla] = VACIO
+        self.siguientes[casilla] = self.libre
+        self.libre = casilla
+        self.length -= 1
+        return dato
+
+    # Insertar al inicio
+    def push_front(self, data):
+        casilla = self._nueva_casilla(data, VACIO, self.head)
+        if self.head == VACIO:
+            self.tail = casilla
+        else:
+            self.anteriores[self.head] = casilla
+        self.head = casilla
+
+    # Insertar al final
+    def push_back(self, data):
+        casilla = self._nueva_casilla(data, self.tail, VACIO)
+        if self.tail == VACIO:
+            self.head = casilla
+        else:
+            self.siguientes[self.tail] = casilla
+        self.tail = casilla
+
+    # Insertar varios al final
+    def extend(self, iterable):
+        for data in iterable:
+            self.push_back(data)
+
+    # Eliminar el primero
+    def pop_front(self):
+        if self.head == VACIO:
+            return None
+        return self._desenlazar(self.head)
+
+    # Eliminar el último
+    def pop_back(self):
+        if self.tail == VACIO:
+            return None
+        return self._desenlazar(self.tail)
+
+    # Ver el primero
+    def peek_front(self):
+        if self.head == VACIO:
+            return None
+        return self.datos[self.head]
+
+    # Ver el último
+    def peek_back(self):
+        if self.tail == VACIO:
+            return None
+        return self.datos[self.tail]
+
+    # Buscar dato, devuelve posición o -1
+    def search(self, data):
+        datos, siguientes = self.datos, self.siguientes
+        actual = self.head
+        posicion = 0
+        while actual != VACIO:
+            if datos[actual] == data:
+                return posicion
+            actual = siguientes[actual]
+            posicion += 1
+        return -1
+
+    # Eliminar primera aparición de un dato
+    def delete(self, data):
+        datos, siguientes = self.datos, self.siguientes
+        actual = self.head
+        while actual != VACIO:
+            if datos[actual] == data:
+                self._desenlazar(actual)
+                return
+            actual = siguientes[actual]
+
+    # Cantidad de elementos (se lleva la cuenta, O(1))
+    def size(self):
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (head -> tail)
+    def __iter__(self):
+        datos, siguientes = self.datos, self.siguientes
+        actual = self.head
+        while actual != VACIO:
+            yield datos[actual]
+            actual = siguientes[actual]
+
+    # Recorrer hacia atrás (tail -> head) para reversed()
+    def __reversed__(self):
+        datos, anteriores = self.datos, self.anteriores
+        actual = self.tail
+        while actual != VACIO:
+            yield datos[actual]
+            actual = anteriores[actual]
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.head == VACIO
+
+    # Representación acotada: nunca recorre más de LIMITE_REPR casillas
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Escribir los datos con el formato None <-> [a] <-> ... <-> None
+    def _mostrar(self, stream, limite, reverso):
+        mostrar(stream, visibles_doble(self, limite, reverso), "[{}] <-> ",
+                "... <-> ", "None <-> ", "None\n")
+
+    # Mostrar hacia adelante (head -> tail)
+    def display(self, stream=None, limite=None):
+        self._mostrar(stream, limite, reverso=False)
+
+    # Mostrar hacia atrás (tail -> head)
+    def display_reverse(self, stream=None, limite=None):
+        self._mostrar(stream, limite, reverso=True)
+
+    # Quitar una casilla de la cadena (O(1)) y devolver su dato
+    def _desenlazar(self, casilla):
+        anterior = self.anteriores[casilla]
+        siguiente = self.siguientes[casilla]
+        if anterior == VACIO:
+            self.head = siguiente
+        else:
+            self.siguientes[anterior] = siguiente
+        if siguiente == VACIO:
+            self.tail = anterior
+        else:
+            self.anteriores[siguiente] = anterior
+        return self._liberar(casilla)
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    mi_lista = ArrayDoublyLinkedList()
+    mi_lista.push_back(10)
+    mi_lista.push_back(20)
+    mi_lista.push_back(30)
+    mi_lista.push_front(5)
+
+    print("Adelante:")
+    mi_lista.display()
+    print("Atrás:")
+    mi_lista.display_reverse()
+
+    mi_lista.delete(20)
+    mi_lista.push_back(40)      # Reutiliza la casilla que dejó el 20
+    mi_lista.display()
+    print(f"Casillas usadas: {len(mi_lista.datos)} para {mi_lista.size()} datos")
+
+    print(f"Pop front: {mi_lista.pop_front()}")
+    print(f"Pop back: {mi_lista.pop_back()}")
+    mi_lista.display()
+    print(f"Tamaño: {mi_lista.size()}")
@@ -0,0 +1,239 @@
+# Cola y Pila asíncronas (AsyncQueue, AsyncStack) para asyncio
+# Usan por dentro la Queue y la Stack de nodos. Las operaciones que pueden
+# esperar son corrutinas: `await cola.dequeue()` duerme hasta que haya un
+# dato, y con maxsize > 0 `await cola.enqueue(x)` duerme hasta que haya lugar.
+# Cada espera es un futuro en una fila de espera; si una tarea se cancela
+# justo después de ser despertada, se despierta a la siguiente para que el
+# aviso no se pierda.
+# dequeue_many / pop_many sacan hasta max_n datos con una sola espera, así
+# el consumidor se despierta una vez por tanda y no una vez por dato.
+#   - enqueue/push devuelven True, o False si venció el timeout.
+#   - dequeue/pop devuelven el dato, o None si venció el timeout.
+
+import asyncio
+from collections import deque
+
+from Queue import Queue
+from Stack import Stack
+
+
+class _AsyncContenedor:
+    def __init__(self, estructura, maxsize):
+        self.estructura = estructura
+        self.maxsize = maxsize              # 0 = sin tope
+        self.esperando_datos = deque()      # Futuros de quienes quieren sacar
+        self.esperando_lugar = deque()      # Futuros de quienes quieren meter
+
+    # Meter un dato; espera si está lleno
+    async def _meter(self, data, timeout):
+        if not await self._esperar(self.esperando_lugar, self._hay_lugar, timeout):
+            return False
+        self._agregar(data)
+        self._despertar(self.esperando_datos)
+        return True
+
+    # Sacar un dato; espera si está vacío
+    async def _sacar(self, timeout):
+        if not await self._esperar(self.esperando_datos, self._hay_datos, timeout):
+            return None
+        dato = self._quitar()
+        self._despertar(self.esperando_lugar)
+        return dato
+
+    # Sacar hasta max_n datos con una sola espera (lista vacía si vence).
+    # Con max_n <= 0 no se espera: no se llevaría nada y se comería el aviso
+    # de un productor. Si quedan datos, se despierta al siguiente consumidor.
+    async def _sacar_varios(self, max_n, timeout):
+        if max_n <= 0:
+            return []
+        if not await self._esperar(self.esperando_datos, self._hay_datos, timeout):
+            return []
+        datos = []
+        while len(datos) < max_n and self._hay_datos():
+            datos.append(self._quitar())
+            self._despertar(self.esperando_lugar)
+        if self._hay_datos():
+            self._despertar(self.esperando_datos)
+        return datos
+
+    # Meter sin esperar: False si está lleno
+    def _meter_sin_esperar(self, data):
+        if not self._hay_lugar():
+            return False
+        self._agregar(data)
+        self._despertar(self.esperando_datos)
+        return True
+
+    # Sacar sin esperar: None si está vacío
+    def _sacar_sin_esperar(self):
+        if not self._hay_datos():
+            return None
+        dato = self._quitar()
+        self._despertar(self.esperando_lugar)
+        return dato
+
+    # Esperar (con timeout opcional) hasta que se cumpla la condición.
+    # El futuro se espera en esta misma tarea y al despertar se vuelve a mirar
+    # la condición: si otra tarea se llevó el lugar o el dato, se sigue
+    # esperando hasta el plazo.
+    async def _esperar(self, fila, condicion, timeout):
+        loop = asyncio.get_running_loop()
+        plazo = None if timeout is None else loop.time() + timeout
+        while not condicion():
+            restante = None if plazo is None else plazo - loop.time()
+            if restante is not None and restante <= 0:
+                return False
+            futuro = loop.create_future()
+            fila.append(futuro)
+            try:
+                await asyncio.wait_for(futuro, restante)
+            except asyncio.TimeoutError:
+                self._retirar(fila, futuro)
+            except BaseException:
+                self._retirar(fila, futuro)
+                # Si ya nos habían despertado, se le pasa el aviso a otro
+                if condicion():
+                    self._despertar(fila)
+                raise
+        return True
+
+    # Sacar de la fila un futuro que ya no espera
+    def _retirar(self, fila, futuro):
+        futuro.cancel()
+        try:
+            fila.remove(futuro)
+        except ValueError:
+            pass
+
+    # Despertar a la primera tarea que siga esperando en la fila
+    def _despertar(self, fila):
+        while fila:
+            futuro = fila.popleft()
+            if not futuro.done():
+                futuro.set_result(None)
+                return
+
+    def _hay_datos(self):
+        return self.estructura.length > 0
+
+    def _hay_lugar(self):
+        return self.maxsize <= 0 or self.estructura.length < self.maxsize
+
+    # Cantidad de elementos
+    def size(self):
+        return self.estructura.length
+
+    def __len__(self):
+        return self.estructura.length
+
+    # Verificar si está vacío
+    def is_empty(self):
+        return self.estructura.length == 0
+
+    # Verificar si llegó al tope
+    def is_full(self):
+        return not self._hay_lugar()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.estructura!r}, maxsize={self.maxsize})"
+
+    # Mostrar con el formato de la estructura de adentro
+    def display(self, stream=None, limite=None):
+        self.estructura.display(stream, limite)
+
+
+class AsyncQueue(_AsyncContenedor):
+    def __init__(self, maxsize=0, pool_size=0):
+        super().__init__(Queue(pool_size), maxsize)
+
+    def _agregar(self, data):
+        self.estructura.enqueue(data)
+
+    def _quitar(self):
+        return self.estructura.dequeue()
+
+    # Agregar al final (rear); espera si está llena
+    async def enqueue(self, data, timeout=None):
+        return await self._meter(data, timeout)
+
+    # Eliminar del frente (front); espera si está vacía
+    async def dequeue(self, timeout=None):
+        return await self._sacar(timeout)
+
+    # Sacar hasta max_n datos en orden con una sola espera
+    async def dequeue_many(self, max_n, timeout=None):
+        return await self._sacar_varios(max_n, timeout)
+
+    # Versiones que no esperan
+    def try_enqueue(self, data):
+        return self._meter_sin_esperar(data)
+
+    def try_dequeue(self):
+        return self._sacar_sin_esperar()
+
+    # Ver el frente sin eliminar
+    def peek(self):
+        return self.estructura.peek()
+
+
+class AsyncStack(_AsyncContenedor):
+    def __init__(self, maxsize=0, pool_size=0):
+        super().__init__(Stack(pool_size), maxsize)
+
+    def _agregar(self, data):
+        self.estructura.push(data)
+
+    def _quitar(self):
+        return self.estructura.pop()
+
+    # Agregar al top; espera si está llena
+    async def push(self, data, timeout=None):
+        return await self._meter(data, timeout)
+
+    # Eliminar y devolver el top; espera si está vacía
+    async def pop(self, timeout=None):
+        return await self._sacar(timeout)
+
+    # Sacar hasta max_n datos desde el top con una sola espera
+    async def pop_many(self, max_n, timeout=None):
+        return await self._sacar_varios(max_n, timeout)
+
+    # Versiones que no esperan
+    def try_push(self, data):
+        return self._meter_sin_esperar(data)
+
+    def try_pop(self):
+        return self._sacar_sin_esperar()
+
+    # Ver el top sin eliminar
+    def peek(self):
+        return self.estructura.peek()
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    async def ejemplo():
+        mi_cola = AsyncQueue(maxsize=4)
+
+        async def productor():
+            for valor in range(10, 110, 10):
+                await mi_cola.enqueue(valor)    # Duerme si la cola está llena
+
+        async def consumidor():
+            while True:
+                tanda = await mi_cola.dequeue_many(3, timeout=0.5)
+                if not tanda:
+                    return
+                print(f"Tanda: {tanda}")
+
+        await asyncio.gather(productor(), consumidor())
+
+        mi_pila = AsyncStack()
+        await mi_pila.push(1)
+        await mi_pila.push(2)
+        mi_pila.display()
+        print(f"Pop: {await mi_pila.pop()}")
+        print(f"Pop: {await mi_pila.pop()}")
+        print(f"Pop con timeout (vacía): {await mi_pila.pop(timeout=0.1)}")
+
+    asyncio.run(ejemplo())
@@ -0,0 +1,112 @@
+# Cola bloqueante acotada (Blocking Queue) — FIFO segura entre hilos
+# Envuelve una Queue de nodos con un candado. Con maxsize > 0 la cola tiene
+# tope: enqueue espera a que haya lugar y dequeue espera a que haya datos,
+# durmiendo en variables de condición (sin consultar is_empty() en bucle).
+# Ambos aceptan timeout (segundos); try_enqueue/try_dequeue no esperan nunca.
+#   - enqueue devuelve True si entró el dato y False si venció el tiempo.
+#   - dequeue devuelve el dato, o None si venció el tiempo (como Queue vacía).
+
+import threading
+
+from Queue import Queue
+
+
+class BlockingQueue:
+    def __init__(self, maxsize=0, pool_size=0):
+        self.maxsize = maxsize          # 0 = sin tope
+        self.cola = Queue(pool_size)
+        self.candado = threading.Lock()
+        self.hay_datos = threading.Condition(self.candado)
+        self.hay_lugar = threading.Condition(self.candado)
+
+    # Agregar al final; espera si está llena (None = sin límite de tiempo)
+    def enqueue(self, data, timeout=None):
+        with self.hay_lugar:
+            if not self.hay_lugar.wait_for(self._hay_lugar, timeout):
+                return False
+            self.cola.enqueue(data)
+            self.hay_datos.notify()
+            return True
+
+    # Agregar sin esperar: False si está llena
+    def try_enqueue(self, data):
+        return self.enqueue(data, timeout=0)
+
+    # Eliminar del frente; espera si está vacía (None = sin límite de tiempo)
+    def dequeue(self, timeout=None):
+        with self.hay_datos:
+            if not self.hay_datos.wait_for(self._hay_datos, timeout):
+                return None
+            dato = self.cola.dequeue()
+            self.hay_lugar.notify()
+            return dato
+
+    # Eliminar sin esperar: None si está vacía
+    def try_dequeue(self):
+        return self.dequeue(timeout=0)
+
+    # Ver el frente sin eliminar
+    def peek(self):
+        with self.candado:
+            return self.cola.peek()
+
+    # Cantidad de elementos
+    def size(self):
+        with self.candado:
+            return self.cola.size()
+
+    def __len__(self):
+        return self.size()
+
+    # Verificar si está vacía
+    def is_empty(self):
+        with self.candado:
+            return self.cola.is_empty()
+
+    # Verificar si llegó al tope
+    def is_full(self):
+        with self.candado:
+            return not self._hay_lugar()
+
+    def __repr__(self):
+        with self.candado:
+            return f"{type(self).__name__}({self.cola!r}, maxsize={self.maxsize})"
+
+    # Mostrar la cola (front -> rear)
+    def display(self, stream=None, limite=None):
+        with self.candado:
+            self.cola.display(stream, limite)
+
+    # Condiciones de espera (se evalúan con el candado tomado)
+    def _hay_datos(self):
+        return self.cola.length > 0
+
+    def _hay_lugar(self):
+        return self.maxsize <= 0 or self.cola.length < self.maxsize
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    mi_cola = BlockingQueue(maxsize=3)
+    recibidos = []
+
+    def consumidor():
+        while True:
+            dato = mi_cola.dequeue(timeout=1)
+            if dato is None or dato == "fin":
+                return
+            recibidos.append(dato)
+
+    hilo = threading.Thread(target=consumidor)
+    hilo.start()
+    for valor in range(10, 110, 10):
+        mi_cola.enqueue(valor)          # Se bloquea si el consumidor se atrasa
+    mi_cola.enqueue("fin")
+    hilo.join()
+    print(f"Recibidos: {recibidos}")
+
+    llena = BlockingQueue(maxsize=2)
+    print(f"try_enqueue: {llena.try_enqueue(1)}, {llena.try_enqueue(2)}, {llena.try_enqueue(3)}")
+    print(f"enqueue con timeout: {llena.enqueue(3, timeout=0.1)}")
+    llena.display()
+    print(f"try_dequeue: {llena.try_dequeue()}  |  Tamaño: {llena.size()}")
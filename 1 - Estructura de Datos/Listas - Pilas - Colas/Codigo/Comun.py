@@ -0,0 +1,202 @@
+# Funciones compartidas por las estructuras de esta carpeta
+# - Salida acotada: repr() muestra a lo sumo LIMITE_REPR datos y display()
+#   escribe en trozos, pudiendo recortar el medio con `limite`.
+# - Búsqueda de varios datos en una sola pasada (search_many).
+# - Operaciones sobre cadenas de nodos enlazados por `next`, usadas por el
+#   merge sort de LinkedList y DoublyLinkedList.
+
+import sys
+from itertools import chain, islice
+from operator import attrgetter
+
+TAM_TROZO = 1024       # Piezas que se juntan antes de cada write()
+LIMITE_REPR = 10       # Datos que muestra repr()
+CORTE = object()       # Marca el hueco cuando display() recorta la salida
+
+
+# Escribir las piezas en trozos, sin armar un único string gigante
+def escribir_en_trozos(stream, piezas):
+    trozo = []
+    for pieza in piezas:
+        trozo.append(pieza)
+        if len(trozo) >= TAM_TROZO:
+            stream.write("".join(trozo))
+            trozo.clear()
+    stream.write("".join(trozo))
+
+
+# Representación acotada: nunca recorre más de LIMITE_REPR datos
+def repr_acotado(estructura):
+    datos = ", ".join(repr(data) for data in islice(estructura, LIMITE_REPR))
+    if estructura.length > LIMITE_REPR:
+        datos += ", ..."
+    return f"{type(estructura).__name__}([{datos}], size={estructura.length})"
+
+
+# Validar el `limite` de display() antes de recorrer nada
+def _validar_limite(limite):
+    if limite is not None and limite < 0:
+        raise ValueError("El límite no puede ser negativo")
+
+
+# Datos a mostrar: todos, o los primeros y últimos `limite` con un corte
+def visibles(estructura, limite):
+    _validar_limite(limite)
+    if limite is None or estructura.length <= 2 * limite:
+        return iter(estructura)
+    return chain(islice(estructura, limite), [CORTE],
+                 islice(estructura, estructura.length - limite, None))
+
+
+# Igual que visibles() para estructuras que se recorren en ambos sentidos:
+# los últimos se toman desde el otro extremo, sin recorrer el medio
+def visibles_doble(estructura, limite, reverso=False):
+    _validar_limite(limite)
+    adelante, atras = (reversed, iter) if reverso else (iter, reversed)
+    if limite is None or estructura.length <= 2 * limite:
+        return adelante(estructura)
+    ultimos = list(islice(atras(estructura), limite))
+    ultimos.reverse()
+    return chain(islice(adelante(estructura), limite), [CORTE], ultimos)
+
+
+# Escribir los datos en `stream` (stdout si es None): cada uno con
+# `plantilla`, el corte con `hueco`, todo entre `apertura` y `cierre`
+def mostrar(stream, datos, plantilla, hueco, apertura="", cierre="\n"):
+    piezas = (hueco if data is CORTE else plantilla.format(data) for data in datos)
+    escribir_en_trozos(sys.stdout if stream is None else stream,
+                       chain([apertura], piezas, [cierre]))
+
+
+# Buscar varios datos recorriendo `datos` una sola vez; devuelve una posición
+# (o -1) por cada valor pedido y se detiene cuando ya encontró todos.
+# Los valores no hashables (listas, dicts...) se comparan con == como en
+# search. Con `conocidos` (por ejemplo un índice) se descartan de entrada
+# los valores hashables que no están ahí.
+def buscar_varios(datos, values, conocidos=None):
+    valores = list(values)
+    resultado = [-1] * len(valores)
+    pendientes = {}             # dato hashable -> índices en valores
+    sueltos = {}                # índice -> dato no hashable
+    for i, valor in enumerate(valores):
+        try:
+            pendientes.setdefault(valor, []).append(i)
+        except TypeError:
+            sueltos[i] = valor
+    if conocidos is not None:
+        pendientes = {valor: indices for valor, indices in pendientes.items()
+                      if valor in conocidos}
+    posicion = 0
+    for data in datos:
+        if not (pendientes or sueltos):
+            break
+        try:
+            indices = pendientes.pop(data, ())
+        except TypeError:
+            indices = _iguales(pendientes, data)
+        for i in indices:
+            resultado[i] = posicion
+        if sueltos:
+            for i in [i for i, valor in sueltos.items() if data == valor]:
+                resultado[i] = posicion
+                del sueltos[i]
+        posicion += 1
+    return resultado
+
+
+# Sacar de `pendientes` los datos iguales (==) a uno no hashable
+def _iguales(pendientes, data):
+    iguales = [valor for valor in pendientes if data == valor]
+    return [i for valor in iguales for i in pendientes.pop(valor)]
+
+
+# Separar los primeros `cantidad` nodos de una cadena; devuelve el resto
+def cortar(nodo, cantidad):
+    for _ in range(cantidad - 1):
+        if nodo is None:
+            return None
+        nodo = nodo.next
+    if nodo is None:
+        return None
+    resto = nodo.next
+    nodo.next = None
+    return resto
+
+
+# Mezclar dos cadenas ordenadas (estable) colgándolas detrás de `cola`;
+# devuelve el nuevo último nodo. clave(nodo) da la clave ya calculada.
+# Si una comparación falla, lo que faltaba mezclar se engancha detrás de lo
+# ya mezclado antes de relanzar el error, así no se pierde ningún nodo.
+def mezclar(cola, izquierda, derecha, clave, reverso):
+    try:
+        if izquierda is not None and derecha is not None:
+            ki, kd = clave(izquierda), clave(derecha)
+            while True:
+                if ki < kd if reverso else kd < ki:
+                    cola.next = derecha
+                    cola = derecha
+                    derecha = derecha.next
+                    if derecha is None:
+                        break
+                    kd = clave(derecha)
+                else:
+                    cola.next = izquierda
+                    cola = izquierda
+                    izquierda = izquierda.next
+                    if izquierda is None:
+                        break
+                    ki = clave(izquierda)
+    except BaseException:
+        cola.next = unir(izquierda, derecha)
+        raise
+    cola.next = izquierda if izquierda is not None else derecha
+    while cola.next is not None:
+        cola = cola.next
+    return cola
+
+
+# Enganchar la cadena `derecha` al final de la cadena `izquierda`
+def unir(izquierda, derecha):
+    if izquierda is None:
+        return derecha
+    ultimo = izquierda
+    while ultimo.next is not None:
+        ultimo = ultimo.next
+    ultimo.next = derecha
+    return izquierda
+
+
+# Función que da la clave de un nodo: su dato, o key(dato) calculada una
+# sola vez por nodo antes de empezar a ordenar
+def claves_por_nodo(nodo, key):
+    if key is None:
+        return attrgetter("data")
+    claves = {}
+    while nodo is not None:
+        claves[nodo] = key(nodo.data)
+        nodo = nodo.next
+    return claves.__getitem__
+
+
+# Ordenar los `cantidad` nodos que cuelgan del centinela `inicio` (merge sort
+# de abajo hacia arriba: estable, O(n log n), sin recursión y sin crear
+# nodos). Devuelve el último nodo. Si una comparación falla, la cadena sigue
+# completa detrás de `inicio` (en un orden intermedio) y se relanza el error.
+def ordenar_cadena(inicio, cantidad, clave, reverso):
+    cola = inicio
+    ancho = 1
+    try:
+        while ancho < cantidad:
+            actual = inicio.next
+            cola = inicio
+            while actual is not None:
+                izquierda = actual
+                derecha = cortar(izquierda, ancho)
+                actual = cortar(derecha, ancho)
+                cola = mezclar(cola, izquierda, derecha, clave, reverso)
+            ancho *= 2
+    except BaseException:
+        # Lo de esta mezcla ya quedó detrás de cola; falta lo no visitado
+        cola.next = unir(cola.next, actual)
+        raise
+    return cola
@@ -1,51 +1,149 @@
 # Lista Doblemente Enlazada (Doubly Linked List)
 # Cada nodo apunta al siguiente (next) y al anterior (prev).
+# Con indexed=True se mantiene además un diccionario dato -> nodos
+# para que delete() y la pertenencia (in) sean O(1). En ese modo los datos
+# deben ser hashables: si no lo son, la inserción falla sin tocar la lista.
+# get/insert/remove_at por posición caminan desde head, tail o el "dedo"
+# (último nodo accedido por posición), el que esté más cerca.
+# push_front/push_back/insert_after/insert_before devuelven el nodo creado:
+# con esa "manija" se puede quitar o mover el nodo en O(1), sin buscarlo.
+# Cada nodo sabe a qué lista pertenece (a través de un "dueño" compartido),
+# así una manija de un nodo ya quitado o de otra lista se rechaza.
+# Con indexed=True y datos repetidos, insertar en el medio cuesta además
+# caminar hasta el nodo igual más cercano para respetar el orden del índice.
+
+from collections import deque
+
+from Comun import (buscar_varios, claves_por_nodo, mostrar, ordenar_cadena,
+                   repr_acotado, visibles_doble)
 
 
 class Nodo:
-    def __init__(self, data):
+    __slots__ = ("data", "next", "prev", "duenio")
+
+    def __init__(self, data, duenio=None):
         self.data = data
         self.next = None
         self.prev = None
+        self.duenio = duenio
+
+
+# Dueño compartido por los nodos de una lista. Al empalmar otra lista, su
+# dueño pasa a apuntar (padre) al de esta, así no hay que tocar cada nodo.
+class _Duenio:
+    __slots__ = ("lista", "padre")
+
+    def __init__(self, lista):
+        self.lista = lista
+        self.padre = None
 
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
         self.tail = None
+        self.length = 0
+        # dato -> su nodo si aparece una vez, o deque de nodos con ese dato
+        # (en orden de la lista) si está repetido
+        self.indice = {} if indexed else None
+        self.duenio = _Duenio(self)
+        self.dedo = None        # Último nodo accedido por posición
+        self.dedo_pos = 0       # Posición de ese nodo
+
+    # Crear una lista a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        lista = cls(indexed)
+        lista.extend(iterable)
+        return lista
 
-    # Insertar al inicio
+    # Insertar al inicio (devuelve el nodo como manija)
     def push_front(self, data):
-        nuevo_nodo = Nodo(data)
+        nuevo_nodo = Nodo(data, self.duenio)
+        if self.indice is not None:
+            self._indexar(nuevo_nodo, al_inicio=True)
+        self.length += 1
+        self.dedo_pos += 1
         if self.head is None:
             self.head = nuevo_nodo
             self.tail = nuevo_nodo
-            return
+            return nuevo_nodo
         nuevo_nodo.next = self.head
         self.head.prev = nuevo_nodo
         self.head = nuevo_nodo
+        return nuevo_nodo
 
-    # Insertar al final
+    # Insertar al final (devuelve el nodo como manija)
     def push_back(self, data):
-        nuevo_nodo = Nodo(data)
+        nuevo_nodo = Nodo(data, self.duenio)
+        if self.indice is not None:
+            self._indexar(nuevo_nodo)
+        self.length += 1
         if self.tail is None:
             self.head = nuevo_nodo
             self.tail = nuevo_nodo
-            return
+            return nuevo_nodo
         nuevo_nodo.prev = self.tail
         self.tail.next = nuevo_nodo
         self.tail = nuevo_nodo
+        return nuevo_nodo
+
+    # Insertar varios al final en una sola pasada. Los nodos se arman en una
+    # cadena aparte y se enganchan recién al terminar, así extend(self) no se
+    # persigue. Con índice cada nodo se indexa al armarlo: si el iterable
+    # falla (o un dato no es hashable) se quitan del índice y la lista queda
+    # igual.
+    def extend(self, iterable):
+        cabeza = anterior = None
+        agregados = 0
+        duenio = self.duenio
+        try:
+            for data in iterable:
+                nuevo_nodo = Nodo(data, duenio)
+                if self.indice is not None:
+                    self._indexar(nuevo_nodo)
+                if anterior is None:
+                    cabeza = nuevo_nodo
+                else:
+                    anterior.next = nuevo_nodo
+                    nuevo_nodo.prev = anterior
+                anterior = nuevo_nodo
+                agregados += 1
+        except BaseException:
+            # De atrás hacia adelante: cada nodo es el último de su cubeta
+            while anterior is not None and self.indice is not None:
+                self._desindexar(anterior)
+                anterior = anterior.prev
+            raise
+        if agregados == 0:
+            return
+        if self.tail is None:
+            self.head = cabeza
+        else:
+            self.tail.next = cabeza
+            cabeza.prev = self.tail
+        self.tail = anterior
+        self.length += agregados
 
     # Eliminar el primero
     def pop_front(self):
         if self.head is None:
             return None
         dato = self.head.data
-        self.head = self.head.next
+        if self.indice is not None:
+            self._desindexar(self.head)
+        if self.dedo is self.head:
+            self.dedo = None
+        self.dedo_pos -= 1
+        nodo = self.head
+        self.head = nodo.next
+        self.length -= 1
         if self.head is None:
             self.tail = None
         else:
             self.head.prev = None
+        nodo.next = None
+        nodo.duenio = None
         return dato
 
     # Eliminar el último
@@ -53,11 +151,19 @@ class DoublyLinkedList:
         if self.tail is None:
             return None
         dato = self.tail.data
-        self.tail = self.tail.prev
+        if self.indice is not None:
+            self._desindexar(self.tail)
+        if self.dedo is self.tail:
+            self.dedo = None
+        nodo = self.tail
+        self.tail = nodo.prev
+        self.length -= 1
         if self.tail is None:
             self.head = None
         else:
             self.tail.next = None
+        nodo.prev = None
+        nodo.duenio = None
         return dato
 
     # Ver el primero
@@ -72,8 +178,51 @@ class DoublyLinkedList:
             return None
         return self.tail.data
 
-    # Buscar dato, devuelve posición o -1
+    # Quitar un nodo a partir de su manija y devolver su dato (O(1))
+    def remove_node(self, nodo):
+        self._validar(nodo)
+        self._desenlazar(nodo)
+        return nodo.data
+
+    # Mover un nodo al inicio sin crear nodos nuevos (O(1))
+    def move_to_front(self, nodo):
+        self._validar(nodo)
+        if nodo is self.head:
+            return
+        self._desenlazar(nodo)
+        self._enlazar(nodo, None, self.head)
+
+    # Mover un nodo al final sin crear nodos nuevos (O(1))
+    def move_to_back(self, nodo):
+        self._validar(nodo)
+        if nodo is self.tail:
+            return
+        self._desenlazar(nodo)
+        self._enlazar(nodo, self.tail, None)
+
+    # Insertar un dato justo después de un nodo (devuelve el nuevo nodo)
+    def insert_after(self, nodo, data):
+        self._validar(nodo)
+        nuevo_nodo = Nodo(data)
+        self._enlazar(nuevo_nodo, nodo, nodo.next)
+        return nuevo_nodo
+
+    # Insertar un dato justo antes de un nodo (devuelve el nuevo nodo)
+    def insert_before(self, nodo, data):
+        self._validar(nodo)
+        nuevo_nodo = Nodo(data)
+        self._enlazar(nuevo_nodo, nodo.prev, nodo)
+        return nuevo_nodo
+
+    # Buscar dato, devuelve posición o -1. Con índice, un dato no hashable
+    # (que igual puede ser == a uno guardado) se busca recorriendo.
     def search(self, data):
+        if self.indice is not None:
+            try:
+                if data not in self.indice:
+                    return -1
+            except TypeError:
+                pass
         actual = self.head
         posicion = 0
         while actual is not None:
@@ -83,72 +232,527 @@ class DoublyLinkedList:
             posicion += 1
         return -1
 
-    # Eliminar primera aparición de un dato
+    # Buscar varios datos en un solo recorrido; devuelve una posición (o -1)
+    # por cada dato pedido. Se detiene cuando ya encontró todos.
+    # Los datos no hashables (listas, dicts...) se comparan con == como en
+    # search. Con índice, los que no están en él ni se buscan.
+    def search_many(self, values):
+        return buscar_varios(self, values, self.indice)
+
+    # Ver el dato en una posición
+    def get(self, posicion):
+        return self._nodo_en(self._normalizar(posicion)).data
+
+    # Insertar en una posición (como list.insert)
+    def insert(self, posicion, data):
+        if posicion < 0:
+            posicion = max(posicion + self.length, 0)
+        if posicion >= self.length:
+            anterior, siguiente = self.tail, None
+        else:
+            siguiente = self._nodo_en(posicion)
+            anterior = siguiente.prev
+        nuevo_nodo = Nodo(data)
+        self._enlazar(nuevo_nodo, anterior, siguiente)
+        self.dedo = nuevo_nodo
+        self.dedo_pos = min(posicion, self.length - 1)
+
+    # Eliminar y devolver el dato en una posición
+    def remove_at(self, posicion):
+        posicion = self._normalizar(posicion)
+        nodo = self._nodo_en(posicion)
+        anterior, siguiente = nodo.prev, nodo.next
+        self._desenlazar(nodo)
+        if siguiente is not None:
+            self.dedo, self.dedo_pos = siguiente, posicion
+        elif anterior is not None:
+            self.dedo, self.dedo_pos = anterior, posicion - 1
+        return nodo.data
+
+    # Eliminar primera aparición de un dato (con índice y un dato hashable,
+    # sin recorrer)
     def delete(self, data):
+        if self.indice is not None:
+            try:
+                nodos = self.indice.get(data)
+            except TypeError:
+                pass
+            else:
+                if nodos is not None:
+                    self._desenlazar(nodos if isinstance(nodos, Nodo) else nodos[0])
+                return
         actual = self.head
         while actual is not None:
             if actual.data == data:
-                if actual == self.head:
-                    self.pop_front()
-                    return
-                if actual == self.tail:
-                    self.pop_back()
-                    return
-                actual.prev.next = actual.next
-                actual.next.prev = actual.prev
+                self._desenlazar(actual)
                 return
             actual = actual.next
 
-    # Cantidad de elementos
+    # Verificar si un dato está en la lista (O(1) con índice)
+    def __contains__(self, data):
+        if self.indice is not None:
+            try:
+                return data in self.indice
+            except TypeError:
+                pass
+        return self.search(data) != -1
+
+    # Eliminar todos los datos que cumplan la condición en una sola pasada.
+    # Devuelve cuántos se eliminaron.
+    def remove_if(self, predicate):
+        eliminados = 0
+        actual = self.head
+        while actual is not None:
+            siguiente = actual.next
+            if predicate(actual.data):
+                self._desenlazar(actual)
+                eliminados += 1
+            actual = siguiente
+        return eliminados
+
+    # Eliminar todas las apariciones de un dato (con índice y un dato
+    # hashable, sin recorrer)
+    def delete_all(self, data):
+        if self.indice is not None:
+            try:
+                nodos = self.indice.get(data)
+            except TypeError:
+                pass
+            else:
+                if nodos is None:
+                    return 0
+                if isinstance(nodos, Nodo):
+                    self._desenlazar(nodos)
+                    return 1
+                eliminados = len(nodos)
+                for nodo in list(nodos):
+                    self._desenlazar(nodo)
+                return eliminados
+        return self.remove_if(lambda valor: valor == data)
+
+    # Pasar todos los nodos de `other` al final en O(1); `other` queda vacía
+    def concat(self, other):
+        self.splice(other, None)
+
+    # Pasar todos los nodos de `other` antes de `at` (posición o nodo; None
+    # = al final) en O(1) más lo que cueste llegar a esa posición.
+    # `other` queda vacía. Con índice se actualiza recorriendo lo movido.
+    def splice(self, other, at):
+        if other is self:
+            raise ValueError("No se puede empalmar una lista consigo misma")
+        if other.head is None:
+            return
+        if self.indice is not None and other.indice is None:
+            # Antes de mover nada: todos los datos deben poder indexarse
+            for data in other:
+                hash(data)
+        siguiente, _ = self._resolver(at)
+        anterior = self.tail if siguiente is None else siguiente.prev
+        primero, ultimo, cantidad = other.head, other.tail, other.length
+        # Los nodos de `other` pasan a ser de esta lista sin recorrerlos
+        other.duenio.lista = None
+        other.duenio.padre = self.duenio
+        other.duenio = _Duenio(other)
+        other._vaciar()
+        primero.prev = anterior
+        ultimo.next = siguiente
+        if anterior is None:
+            self.head = primero
+        else:
+            anterior.next = primero
+        if siguiente is None:
+            self.tail = ultimo
+        else:
+            siguiente.prev = ultimo
+        self.length += cantidad
+        self.dedo = None
+        if self.indice is None:
+            return
+        if siguiente is not None:
+            self._reindexar()
+            return
+        actual = primero
+        while actual is not None:
+            self._indexar(actual)
+            actual = actual.next
+
+    # Cortar la lista en `at` (posición o nodo): esta lista se queda con lo
+    # anterior y se devuelve una lista nueva con el resto, sin copiar nodos.
+    # Con un nodo hay que contar los elementos que se van.
+    def split_at(self, at):
+        nodo, posicion = self._resolver(at)
+        nueva = DoublyLinkedList(self.indice is not None)
+        if nodo is None:
+            return nueva
+        if posicion is not None:
+            cantidad = self.length - posicion
+        else:
+            cantidad = 0
+            actual = nodo
+            while actual is not None:
+                cantidad += 1
+                actual = actual.next
+        anterior = nodo.prev
+        if anterior is None:
+            self.head = None
+        else:
+            anterior.next = None
+        nodo.prev = None
+        nueva.head, nueva.tail, nueva.length = nodo, self.tail, cantidad
+        self._repartir_duenio(nueva, anterior, cantidad)
+        self.tail = anterior
+        self.length -= cantidad
+        self.dedo = None
+        if self.indice is not None:
+            # Los nodos que se van son los últimos de cada cubeta
+            actual = nueva.tail
+            while actual is not None:
+                self._desindexar(actual)
+                nueva._indexar(actual, al_inicio=True)
+                actual = actual.prev
+        return nueva
+
+    # Invertir la lista en el lugar: se intercambian next y prev de cada nodo
+    # (O(n), sin crear nodos)
+    def reverse(self):
+        actual = self.head
+        while actual is not None:
+            actual.next, actual.prev = actual.prev, actual.next
+            actual = actual.prev
+        self.head, self.tail = self.tail, self.head
+        self.dedo_pos = self.length - 1 - self.dedo_pos
+        if self.indice is not None:
+            for nodos in self.indice.values():
+                if isinstance(nodos, deque):
+                    nodos.reverse()
+
+    # Rotar k lugares a la derecha (k < 0 = a la izquierda), como deque.rotate.
+    # Solo se camina hasta el nuevo head por el lado más corto: O(min(k, n-k)).
+    def rotate(self, k=1):
+        if self.length < 2:
+            return
+        k %= self.length
+        if k == 0:
+            return
+        # Los últimos k nodos pasan adelante: el nuevo head es el de n-k
+        if k <= self.length - k:
+            nuevo_head = self.tail
+            for _ in range(k - 1):
+                nuevo_head = nuevo_head.prev
+        else:
+            nuevo_head = self.head
+            for _ in range(self.length - k):
+                nuevo_head = nuevo_head.next
+        if self.indice is not None:
+            self._rotar_indice(nuevo_head, k)
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.head = nuevo_head
+        self.tail = nuevo_head.prev
+        self.tail.next = None
+        self.head.prev = None
+        self.dedo_pos = (self.dedo_pos + k) % self.length
+
+    # Ordenar reenlazando los nodos existentes (merge sort de abajo hacia
+    # arriba: estable, O(n log n), sin recursión y sin crear nodos).
+    # key se llama una vez por dato. Si una comparación falla, la lista queda
+    # con todos sus nodos (en un orden intermedio) y se relanza el error.
+    def sort(self, key=None, reverse=False):
+        if self.length < 2:
+            return
+        clave = claves_por_nodo(self.head, key)
+        inicio = Nodo(None)         # Centinela del que cuelga la cadena
+        inicio.next = self.head
+        try:
+            ordenar_cadena(inicio, self.length, clave, reverse)
+        finally:
+            self.head = inicio.next
+            self.dedo = None
+            # Se reconstruyen los prev (y el tail) en una pasada
+            anterior = None
+            actual = self.head
+            while actual is not None:
+                actual.prev = anterior
+                anterior = actual
+                actual = actual.next
+            self.tail = anterior
+            if self.indice is not None:
+                self._reindexar()
+
+    # Cantidad de elementos (se lleva la cuenta, O(1))
     def size(self):
-        contador = 0
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (head -> tail) sin copiar la estructura
+    def __iter__(self):
         actual = self.head
         while actual is not None:
-            contador += 1
+            yield actual.data
             actual = actual.next
-        return contador
+
+    # Recorrer hacia atrás (tail -> head) para reversed()
+    def __reversed__(self):
+        actual = self.tail
+        while actual is not None:
+            yield actual.data
+            actual = actual.prev
 
     # Verificar si está vacía
     def is_empty(self):
         return self.head is None
 
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Escribir los datos con el formato None <-> [a] <-> ... <-> None
+    def _mostrar(self, stream, limite, reverso):
+        mostrar(stream, visibles_doble(self, limite, reverso), "[{}] <-> ",
+                "... <-> ", "None <-> ", "None\n")
+
     # Mostrar hacia adelante (head -> tail)
-    def display(self):
-        actual = self.head
-        resultado = "None <-> "
-        while actual is not None:
-            resultado += f"[{actual.data}] <-> "
-            actual = actual.next
-        resultado += "None"
-        print(resultado)
+    def display(self, stream=None, limite=None):
+        self._mostrar(stream, limite, reverso=False)
 
     # Mostrar hacia atrás (tail -> head)
-    def display_reverse(self):
-        actual = self.tail
-        resultado = "None <-> "
+    def display_reverse(self, stream=None, limite=None):
+        self._mostrar(stream, limite, reverso=True)
+
+    # Validar una posición (admite negativas como las listas de Python)
+    def _normalizar(self, posicion):
+        if posicion < 0:
+            posicion += self.length
+        if not 0 <= posicion < self.length:
+            raise IndexError("Posición fuera de rango")
+        return posicion
+
+    # Nodo en una posición válida, caminando desde head, tail o el dedo
+    # (el más cercano). Deja el dedo en ese nodo.
+    def _nodo_en(self, posicion):
+        actual, desde = self.head, 0
+        if self.length - 1 - posicion < posicion:
+            actual, desde = self.tail, self.length - 1
+        if self.dedo is not None and abs(self.dedo_pos - posicion) < abs(desde - posicion):
+            actual, desde = self.dedo, self.dedo_pos
+        if desde <= posicion:
+            for _ in range(posicion - desde):
+                actual = actual.next
+        else:
+            for _ in range(desde - posicion):
+                actual = actual.prev
+        self.dedo = actual
+        self.dedo_pos = posicion
+        return actual
+
+    # Nodo en `at` (posición 0..length o nodo; None o length = al final).
+    # Devuelve (nodo, posición); la posición es None si se pasó un nodo.
+    def _resolver(self, at):
+        if at is None:
+            return None, self.length
+        if isinstance(at, Nodo):
+            self._validar(at)
+            return at, None
+        if at < 0:
+            at += self.length
+        if at == self.length:
+            return None, at
+        return self._nodo_en(self._normalizar(at)), at
+
+    # Dejar la lista vacía sin tocar los nodos (ahora son de otra lista)
+    def _vaciar(self):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.dedo = None
+        if self.indice is not None:
+            self.indice = {}
+
+    # Rechazar manijas de nodos quitados o que son de otra lista
+    def _validar(self, nodo):
+        if self._lista_de(nodo) is not self:
+            raise ValueError("El nodo no pertenece a la lista")
+
+    # Lista dueña de un nodo (None si fue quitado). Sigue los padres hasta la
+    # raíz y deja todo el camino apuntando a ella.
+    @staticmethod
+    def _lista_de(nodo):
+        raiz = nodo.duenio
+        if raiz is None:
+            return None
+        while raiz.padre is not None:
+            raiz = raiz.padre
+        duenio = nodo.duenio
+        while duenio is not raiz:
+            duenio.padre, duenio = raiz, duenio.padre
+        nodo.duenio = raiz
+        return raiz.lista
+
+    # Al cortar, marcar el tramo más corto: si se van menos nodos de los que
+    # quedan se les pone el dueño de `nueva`; si no, los que quedan reciben un
+    # dueño nuevo y el viejo pasa a `nueva`.
+    def _repartir_duenio(self, nueva, ultimo_que_queda, cantidad):
+        if cantidad <= self.length - cantidad:
+            actual = nueva.head
+            while actual is not None:
+                actual.duenio = nueva.duenio
+                actual = actual.next
+            return
+        self.duenio.lista = nueva
+        nueva.duenio = self.duenio
+        self.duenio = _Duenio(self)
+        actual = ultimo_que_queda
         while actual is not None:
-            resultado += f"[{actual.data}] <-> "
+            actual.duenio = self.duenio
             actual = actual.prev
-        resultado += "None"
-        print(resultado)
+
+    # Enlazar un nodo nuevo entre anterior y siguiente (None = extremo).
+    # Con índice, un dato no hashable falla antes de tocar la lista.
+    def _enlazar(self, nodo, anterior, siguiente):
+        if self.indice is not None:
+            hash(nodo.data)
+        nodo.duenio = self.duenio
+        nodo.prev = anterior
+        nodo.next = siguiente
+        if anterior is None:
+            self.head = nodo
+        else:
+            anterior.next = nodo
+        if siguiente is None:
+            self.tail = nodo
+        else:
+            siguiente.prev = nodo
+        self.length += 1
+        self.dedo = None
+        if self.indice is not None:
+            self._indexar_en_orden(nodo)
+
+    # Quitar un nodo conocido de la cadena (O(1))
+    def _desenlazar(self, nodo):
+        self.dedo = None
+        if self.indice is not None:
+            self._desindexar(nodo)
+        if nodo.prev is None:
+            self.head = nodo.next
+        else:
+            nodo.prev.next = nodo.next
+        if nodo.next is None:
+            self.tail = nodo.prev
+        else:
+            nodo.next.prev = nodo.prev
+        nodo.prev = None
+        nodo.next = None
+        nodo.duenio = None
+        self.length -= 1
+
+    # Agregar un nodo al final (o al inicio) de la cubeta de su dato. La
+    # primera aparición se guarda sola; el deque se crea recién al repetirse,
+    # así una lista de datos casi todos distintos no paga un deque por dato.
+    def _indexar(self, nodo, al_inicio=False):
+        nodos = self.indice.setdefault(nodo.data, nodo)
+        if nodos is nodo:
+            return
+        if isinstance(nodos, Nodo):
+            nodos = self.indice[nodo.data] = deque((nodos,))
+        if al_inicio:
+            nodos.appendleft(nodo)
+        else:
+            nodos.append(nodo)
+
+    # Indexar un nodo enlazado en cualquier lugar, respetando el orden de la
+    # lista. En los extremos o sin repetidos es O(1); con repetidos se busca
+    # el nodo igual más cercano hacia ambos lados para ubicarse en la cubeta,
+    # así que cuesta esa distancia más el largo de la cubeta.
+    def _indexar_en_orden(self, nodo):
+        nodos = self.indice.get(nodo.data)
+        if nodos is None or nodo.next is None:
+            self._indexar(nodo)
+            return
+        if nodo.prev is None:
+            self._indexar(nodo, al_inicio=True)
+            return
+        if isinstance(nodos, Nodo):
+            nodos = self.indice[nodo.data] = deque((nodos,))
+        atras, adelante = nodo.prev, nodo.next
+        while atras is not None or adelante is not None:
+            if adelante is not None:
+                if adelante.data == nodo.data:
+                    nodos.insert(nodos.index(adelante), nodo)
+                    return
+                adelante = adelante.next
+            if atras is not None:
+                if atras.data == nodo.data:
+                    nodos.insert(nodos.index(atras) + 1, nodo)
+                    return
+                atras = atras.prev
+        nodos.append(nodo)
+
+    # Quitar un nodo de su cubeta del índice (si queda uno solo, se vuelve a
+    # guardar sin deque)
+    def _desindexar(self, nodo):
+        nodos = self.indice[nodo.data]
+        if nodos is nodo:
+            del self.indice[nodo.data]
+            return
+        if nodos[0] is nodo:
+            nodos.popleft()
+        elif nodos[-1] is nodo:
+            nodos.pop()
+        else:
+            nodos.remove(nodo)
+        if len(nodos) == 1:
+            self.indice[nodo.data] = nodos[0]
+
+    # Acomodar las cubetas antes de rotar, recorriendo solo el tramo corto:
+    # los nodos que pasan adelante salen del final de su cubeta y viceversa
+    def _rotar_indice(self, nuevo_head, k):
+        if k <= self.length - k:
+            actual = self.tail
+            while actual is not nuevo_head.prev:
+                nodos = self.indice[actual.data]
+                if isinstance(nodos, deque):
+                    nodos.rotate(1)
+                actual = actual.prev
+        else:
+            actual = self.head
+            while actual is not nuevo_head:
+                nodos = self.indice[actual.data]
+                if isinstance(nodos, deque):
+                    nodos.rotate(-1)
+                actual = actual.next
+
+    # Reconstruir el índice siguiendo el orden actual de la lista
+    def _reindexar(self):
+        self.indice = {}
+        actual = self.head
+        while actual is not None:
+            self._indexar(actual)
+            actual = actual.next
 
 
 # --- Ejemplo de uso ---
-mi_lista = DoublyLinkedList()
-mi_lista.push_back(10)
-mi_lista.push_back(20)
-mi_lista.push_back(30)
-mi_lista.push_front(5)
-
-print("Adelante:")
-mi_lista.display()
-print("Atrás:")
-mi_lista.display_reverse()
-
-mi_lista.delete(20)
-mi_lista.display()
-
-print(f"Pop front: {mi_lista.pop_front()}")
-print(f"Pop back: {mi_lista.pop_back()}")
-mi_lista.display()
-print(f"Tamaño: {mi_lista.size()}")
+if __name__ == "__main__":
+    mi_lista = DoublyLinkedList()
+    mi_lista.push_back(10)
+    mi_lista.push_back(20)
+    mi_lista.push_back(30)
+    mi_lista.push_front(5)
+
+    print("Adelante:")
+    mi_lista.display()
+    print("Atrás:")
+    mi_lista.display_reverse()
+
+    mi_lista.delete(20)
+    mi_lista.display()
+
+    print(f"Pop front: {mi_lista.pop_front()}")
+    print(f"Pop back: {mi_lista.pop_back()}")
+    mi_lista.display()
+    print(f"Tamaño: {mi_lista.size()}")
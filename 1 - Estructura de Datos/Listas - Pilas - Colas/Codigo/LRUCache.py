@@ -0,0 +1,253 @@
+# Caché acotada LRU / LFU sobre DoublyLinkedList
+# Un diccionario clave -> entrada da acceso O(1) y la lista doble guarda el
+# orden de desalojo: cada entrada conoce su nodo (manija), así get, put y el
+# desalojo son O(1) sin buscar en la lista.
+#   - LRUCache: sale la clave usada hace más tiempo (head = menos reciente).
+#   - LFUCache: sale la clave usada menos veces; entre empatadas, la menos
+#     reciente. Hay una lista de claves por frecuencia, y esas listas van en
+#     otra lista doble ordenada por frecuencia: la de menor frecuencia es
+#     siempre la primera, así el desalojo sigue siendo O(1) aunque un delete
+#     o un vencimiento vacíe la lista de la frecuencia mínima.
+# Opcionales: vencimiento por entrada (ttl, en segundos), una función que se
+# llama al desalojar y contadores de aciertos, fallos y desalojos.
+# Las entradas con ttl van también a un montículo ordenado por vencimiento:
+# con la caché llena, primero se quitan las vencidas y solo si no liberan
+# lugar se desaloja una entrada vigente.
+
+import heapq
+import time
+from itertools import count
+
+from DoublyLinkedList import DoublyLinkedList
+
+
+class Entrada:
+    __slots__ = ("valor", "nodo", "vence", "frecuencia", "secuencia")
+
+    def __init__(self, valor, vence):
+        self.valor = valor
+        self.nodo = None
+        self.vence = vence
+        self.frecuencia = 1
+        self.secuencia = None     # Número del último put (ver el montículo)
+
+
+class LRUCache:
+    def __init__(self, capacity, on_evict=None, ttl=None, reloj=time.monotonic):
+        if capacity < 1:
+            raise ValueError("La capacidad debe ser al menos 1")
+        self.capacity = capacity
+        self.on_evict = on_evict      # on_evict(clave, valor) al desalojar
+        self.ttl = ttl                # Vencimiento por defecto (None = nunca)
+        self.reloj = reloj
+        self.entradas = {}
+        self.orden = DoublyLinkedList()
+        self.vencimientos = []        # Montículo (vence, n, clave, entrada)
+        self.contador = count()       # Numera cada put; desempata el montículo
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # Obtener un valor (cuenta como uso); si no está o venció, default
+    def get(self, key, default=None):
+        entrada = self.entradas.get(key)
+        if entrada is None or self._vencida(key, entrada):
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._tocar(key, entrada)
+        return entrada.valor
+
+    # Guardar un valor; si la caché está llena desaloja según la política
+    def put(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        vence = None if ttl is None else self.reloj() + ttl
+        entrada = self.entradas.get(key)
+        if entrada is not None:
+            entrada.valor = value
+            entrada.vence = vence
+            self._tocar(key, entrada)
+        else:
+            if len(self.entradas) >= self.capacity:
+                self._purgar_vencidas()
+            if len(self.entradas) >= self.capacity:
+                self._desalojar()
+            entrada = Entrada(value, vence)
+            self.entradas[key] = entrada
+            self._agregar(key, entrada)
+        entrada.secuencia = next(self.contador)
+        if vence is not None:
+            heapq.heappush(self.vencimientos, (vence, entrada.secuencia, key, entrada))
+            if len(self.vencimientos) > 2 * self.capacity:
+                self._compactar_vencimientos()
+
+    # Quitar una clave sin contarla como desalojo
+    def delete(self, key):
+        entrada = self.entradas.pop(key, None)
+        if entrada is None:
+            return False
+        self._quitar(entrada)
+        return True
+
+    # Porcentaje de aciertos sobre el total de get()
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # Verificar si una clave está (sin contarlo como uso)
+    def __contains__(self, key):
+        entrada = self.entradas.get(key)
+        return entrada is not None and not self._vencida(key, entrada)
+
+    # Cantidad de entradas guardadas
+    def __len__(self):
+        return len(self.entradas)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(size={len(self)}, capacity={self.capacity}, "
+                f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})")
+
+    # Mostrar las claves en orden de desalojo (la primera sale antes)
+    def display(self):
+        self.orden.display()
+
+    # Si la entrada venció se quita y se avisa como desalojo
+    def _vencida(self, key, entrada):
+        if entrada.vence is None or self.reloj() < entrada.vence:
+            return False
+        self._expirar(key, entrada)
+        return True
+
+    def _expirar(self, key, entrada):
+        del self.entradas[key]
+        self._quitar(entrada)
+        self.expirations += 1
+        if self.on_evict is not None:
+            self.on_evict(key, entrada.valor)
+
+    # Quitar todas las entradas vencidas, de la más vieja a la más nueva.
+    # En el montículo quedan registros viejos (claves borradas o vueltas a
+    # guardar): se reconocen porque su número ya no es el del último put de
+    # la entrada. Comparar solo el vencimiento no alcanza: dos put en el mismo
+    # tic del reloj dan el mismo `vence`.
+    def _purgar_vencidas(self):
+        ahora = self.reloj()
+        while self.vencimientos and self.vencimientos[0][0] <= ahora:
+            _, secuencia, key, entrada = heapq.heappop(self.vencimientos)
+            if self._registro_vigente(secuencia, key, entrada):
+                self._expirar(key, entrada)
+
+    # Descartar los registros viejos cuando el montículo creció demasiado
+    def _compactar_vencimientos(self):
+        self.vencimientos = [registro for registro in self.vencimientos
+                             if self._registro_vigente(registro[1], registro[2], registro[3])]
+        heapq.heapify(self.vencimientos)
+
+    def _registro_vigente(self, secuencia, key, entrada):
+        return self.entradas.get(key) is entrada and entrada.secuencia == secuencia
+
+    # Sacar la víctima según la política y avisar
+    def _desalojar(self):
+        key = self._victima()
+        entrada = self.entradas.pop(key)
+        self._quitar(entrada)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, entrada.valor)
+
+    # --- Política LRU: la lista va de menos a más reciente ---
+    def _agregar(self, key, entrada):
+        entrada.nodo = self.orden.push_back(key)
+
+    def _tocar(self, key, entrada):
+        self.orden.move_to_back(entrada.nodo)
+
+    def _quitar(self, entrada):
+        self.orden.remove_node(entrada.nodo)
+
+    def _victima(self):
+        return self.orden.peek_front()
+
+
+class LFUCache(LRUCache):
+    def __init__(self, capacity, on_evict=None, ttl=None, reloj=time.monotonic):
+        super().__init__(capacity, on_evict, ttl, reloj)
+        # Listas de claves por frecuencia, de menor a mayor frecuencia
+        self.cubetas = DoublyLinkedList()
+        self.frecuencias = {}       # frecuencia -> nodo de su lista en cubetas
+
+    # Mostrar las claves agrupadas por frecuencia de uso
+    def display(self):
+        for frecuencia in sorted(self.frecuencias):
+            print(f"{frecuencia} uso(s): ", end="")
+            self.frecuencias[frecuencia].data.display()
+
+    # --- Política LFU: una lista por frecuencia, de menos a más reciente ---
+    def _agregar(self, key, entrada):
+        entrada.frecuencia = 1
+        cubeta = self.frecuencias.get(1)
+        if cubeta is None:
+            cubeta = self._nueva_cubeta(1)
+        entrada.nodo = cubeta.data.push_back(key)
+
+    def _tocar(self, key, entrada):
+        vieja = self.frecuencias[entrada.frecuencia]
+        nueva = self.frecuencias.get(entrada.frecuencia + 1)
+        if nueva is None:
+            nueva = self._nueva_cubeta(entrada.frecuencia + 1, vieja)
+        self._quitar(entrada)
+        entrada.frecuencia += 1
+        entrada.nodo = nueva.data.push_back(key)
+
+    def _quitar(self, entrada):
+        cubeta = self.frecuencias[entrada.frecuencia]
+        cubeta.data.remove_node(entrada.nodo)
+        if cubeta.data.is_empty():
+            self.cubetas.remove_node(cubeta)
+            del self.frecuencias[entrada.frecuencia]
+
+    def _victima(self):
+        return self.cubetas.peek_front().peek_front()
+
+    # Crear la lista de una frecuencia: justo después de la cubeta `despues`
+    # (la de la frecuencia anterior) o, sin ella, al inicio
+    def _nueva_cubeta(self, frecuencia, despues=None):
+        if despues is None:
+            cubeta = self.cubetas.push_front(DoublyLinkedList())
+        else:
+            cubeta = self.cubetas.insert_after(despues, DoublyLinkedList())
+        self.frecuencias[frecuencia] = cubeta
+        return cubeta
+
+
+# Crear una caché eligiendo la política por nombre ("lru" o "lfu")
+def make_cache(capacity, policy="lru", **opciones):
+    politicas = {"lru": LRUCache, "lfu": LFUCache}
+    if policy not in politicas:
+        raise ValueError(f"Política desconocida: {policy}")
+    return politicas[policy](capacity, **opciones)
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    desalojados = []
+    mi_cache = LRUCache(3, on_evict=lambda clave, valor: desalojados.append(clave))
+    mi_cache.put("a", 1)
+    mi_cache.put("b", 2)
+    mi_cache.put("c", 3)
+    mi_cache.get("a")               # "a" pasa a ser la más reciente
+    mi_cache.put("d", 4)            # Sale "b", la menos reciente
+    mi_cache.display()
+    print(f"Desalojados: {desalojados}")
+    print(f"get('b'): {mi_cache.get('b')}  |  get('c'): {mi_cache.get('c')}")
+    print(mi_cache)
+
+    mi_lfu = make_cache(2, policy="lfu")
+    mi_lfu.put("x", 10)
+    mi_lfu.put("y", 20)
+    mi_lfu.get("x")
+    mi_lfu.get("x")
+    mi_lfu.put("z", 30)             # Sale "y", la menos usada
+    mi_lfu.display()
+    print(mi_lfu)
@@ -1,8 +1,16 @@
 # Lista Enlazada Simple (Linked List)
 # Estructura lineal donde cada nodo apunta al siguiente.
+# Se guarda también el último nodo (tail) para insertar al final en O(1),
+# y un "dedo" (el último nodo accedido por posición) para que los accesos
+# cercanos con get/insert/remove_at no tengan que empezar desde head.
+
+from Comun import (buscar_varios, claves_por_nodo, mostrar, ordenar_cadena,
+                   repr_acotado, visibles)
 
 
 class Nodo:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -11,30 +19,74 @@ class Nodo:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.length = 0
+        self.dedo = None        # Último nodo accedido por posición
+        self.dedo_pos = 0       # Posición de ese nodo
+
+    # Crear una lista a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable):
+        lista = cls()
+        lista.extend(iterable)
+        return lista
 
     # Insertar al inicio
     def push_front(self, data):
         nuevo_nodo = Nodo(data)
         nuevo_nodo.next = self.head
         self.head = nuevo_nodo
+        self.length += 1
+        self.dedo_pos += 1
+        if self.tail is None:
+            self.tail = nuevo_nodo
 
     # Insertar al final
     def push_back(self, data):
         nuevo_nodo = Nodo(data)
-        if self.head is None:
+        self.length += 1
+        if self.tail is None:
             self.head = nuevo_nodo
+            self.tail = nuevo_nodo
             return
-        actual = self.head
-        while actual.next is not None:
-            actual = actual.next
-        actual.next = nuevo_nodo
+        self.tail.next = nuevo_nodo
+        self.tail = nuevo_nodo
+
+    # Insertar varios al final en una sola pasada. Los nodos se arman en una
+    # cadena aparte y se enganchan al final recién al terminar: si el
+    # iterable falla la lista queda igual, y extend(self) no se persigue.
+    def extend(self, iterable):
+        cabeza = anterior = None
+        agregados = 0
+        for data in iterable:
+            nuevo_nodo = Nodo(data)
+            if anterior is None:
+                cabeza = nuevo_nodo
+            else:
+                anterior.next = nuevo_nodo
+            anterior = nuevo_nodo
+            agregados += 1
+        if agregados == 0:
+            return
+        if self.tail is None:
+            self.head = cabeza
+        else:
+            self.tail.next = cabeza
+        self.tail = anterior
+        self.length += agregados
 
     # Eliminar el primero
     def pop_front(self):
         if self.head is None:
             return None
         dato = self.head.data
+        if self.dedo is self.head:
+            self.dedo = None
+        self.dedo_pos -= 1
         self.head = self.head.next
+        self.length -= 1
+        if self.head is None:
+            self.tail = None
         return dato
 
     # Eliminar el último
@@ -42,14 +94,13 @@ class LinkedList:
         if self.head is None:
             return None
         if self.head.next is None:
-            dato = self.head.data
-            self.head = None
-            return dato
-        actual = self.head
-        while actual.next.next is not None:
-            actual = actual.next
-        dato = actual.next.data
+            return self.pop_front()
+        # Sin puntero prev hay que buscar el penúltimo (desde head o el dedo)
+        actual = self._nodo_en(self.length - 2)
+        dato = self.tail.data
         actual.next = None
+        self.tail = actual
+        self.length -= 1
         return dato
 
     # Ver el primero
@@ -60,12 +111,9 @@ class LinkedList:
 
     # Ver el último
     def peek_back(self):
-        if self.head is None:
+        if self.tail is None:
             return None
-        actual = self.head
-        while actual.next is not None:
-            actual = actual.next
-        return actual.data
+        return self.tail.data
 
     # Buscar dato, devuelve posición o -1
     def search(self, data):
@@ -78,56 +126,248 @@ class LinkedList:
             posicion += 1
         return -1
 
+    # Buscar varios datos en un solo recorrido; devuelve una posición (o -1)
+    # por cada dato pedido. Se detiene cuando ya encontró todos.
+    # Los datos no hashables (listas, dicts...) se comparan con == como en search.
+    def search_many(self, values):
+        return buscar_varios(self, values)
+
+    # Ver el dato en una posición
+    def get(self, posicion):
+        return self._nodo_en(self._normalizar(posicion)).data
+
+    # Insertar en una posición (como list.insert)
+    def insert(self, posicion, data):
+        if posicion < 0:
+            posicion = max(posicion + self.length, 0)
+        if posicion == 0:
+            self.push_front(data)
+            return
+        if posicion >= self.length:
+            self.push_back(data)
+            return
+        anterior = self._nodo_en(posicion - 1)
+        nuevo_nodo = Nodo(data)
+        nuevo_nodo.next = anterior.next
+        anterior.next = nuevo_nodo
+        self.length += 1
+
+    # Eliminar y devolver el dato en una posición
+    def remove_at(self, posicion):
+        posicion = self._normalizar(posicion)
+        if posicion == 0:
+            return self.pop_front()
+        anterior = self._nodo_en(posicion - 1)
+        nodo = anterior.next
+        anterior.next = nodo.next
+        if nodo is self.tail:
+            self.tail = anterior
+        self.length -= 1
+        return nodo.data
+
     # Eliminar primera aparición de un dato
     def delete(self, data):
+        self.dedo = None
         if self.head is None:
             return
         if self.head.data == data:
-            self.head = self.head.next
+            self.pop_front()
             return
         actual = self.head
         while actual.next is not None:
             if actual.next.data == data:
+                if actual.next is self.tail:
+                    self.tail = actual
                 actual.next = actual.next.next
+                self.length -= 1
                 return
             actual = actual.next
 
-    # Cantidad de elementos
+    # Eliminar todos los datos que cumplan la condición en una sola pasada.
+    # Devuelve cuántos se eliminaron.
+    # Si el predicado falla a mitad de camino, lo ya quitado queda quitado y
+    # la lista sigue consistente.
+    def remove_if(self, predicate):
+        self.dedo = None
+        eliminados = 0
+        anterior = None
+        actual = self.head
+        try:
+            while actual is not None:
+                siguiente = actual.next
+                if predicate(actual.data):
+                    if anterior is None:
+                        self.head = siguiente
+                    else:
+                        anterior.next = siguiente
+                    actual.next = None
+                    self.length -= 1
+                    eliminados += 1
+                else:
+                    anterior = actual
+                actual = siguiente
+        finally:
+            # El tail solo cambia si se quitó el último nodo
+            if self.head is None:
+                self.tail = None
+            elif anterior is not None and anterior.next is None:
+                self.tail = anterior
+        return eliminados
+
+    # Eliminar todas las apariciones de un dato
+    def delete_all(self, data):
+        return self.remove_if(lambda valor: valor == data)
+
+    # Pasar todos los nodos de `other` al final en O(1); `other` queda vacía
+    def concat(self, other):
+        self.splice(other, self.length)
+
+    # Pasar todos los nodos de `other` antes de la posición `at` (0..length).
+    # Enlazar es O(1); llegar a la posición cuesta lo que camine el dedo.
+    # `other` queda vacía.
+    def splice(self, other, at):
+        if other is self:
+            raise ValueError("No se puede empalmar una lista consigo misma")
+        if at < 0:
+            at += self.length
+        if not 0 <= at <= self.length:
+            raise IndexError("Posición fuera de rango")
+        if other.head is None:
+            return
+        primero, ultimo, cantidad = other.head, other.tail, other.length
+        other._vaciar()
+        if at == 0:
+            ultimo.next = self.head
+            self.head = primero
+            if self.tail is None:
+                self.tail = ultimo
+            self.dedo = None
+        elif at == self.length:
+            self.tail.next = primero
+            self.tail = ultimo
+        else:
+            anterior = self._nodo_en(at - 1)
+            ultimo.next = anterior.next
+            anterior.next = primero
+        self.length += cantidad
+
+    # Cortar la lista en la posición `at`: esta lista se queda con lo anterior
+    # y se devuelve una lista nueva con el resto, sin copiar nodos
+    def split_at(self, at):
+        if at < 0:
+            at += self.length
+        if not 0 <= at <= self.length:
+            raise IndexError("Posición fuera de rango")
+        nueva = LinkedList()
+        if at == self.length:
+            return nueva
+        if at == 0:
+            nueva.head, nueva.tail, nueva.length = self.head, self.tail, self.length
+            self._vaciar()
+            return nueva
+        anterior = self._nodo_en(at - 1)
+        nueva.head, nueva.tail = anterior.next, self.tail
+        nueva.length = self.length - at
+        anterior.next = None
+        self.tail = anterior
+        self.length = at
+        return nueva
+
+    # Ordenar reenlazando los nodos existentes (merge sort de abajo hacia
+    # arriba: estable, O(n log n), sin recursión y sin crear nodos).
+    # key se llama una vez por dato. Si una comparación falla, la lista queda
+    # con todos sus nodos (en un orden intermedio) y se relanza el error.
+    def sort(self, key=None, reverse=False):
+        if self.length < 2:
+            return
+        clave = claves_por_nodo(self.head, key)
+        inicio = Nodo(None)         # Centinela del que cuelga la cadena
+        inicio.next = self.head
+        try:
+            self.tail = ordenar_cadena(inicio, self.length, clave, reverse)
+        finally:
+            self.head = inicio.next
+            self.dedo = None
+            # Si falló, el tail viejo sigue en la cadena: se avanza hasta el final
+            while self.tail.next is not None:
+                self.tail = self.tail.next
+
+    # Cantidad de elementos (se lleva la cuenta, O(1))
     def size(self):
-        contador = 0
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (head -> tail) sin copiar la estructura
+    def __iter__(self):
         actual = self.head
         while actual is not None:
-            contador += 1
+            yield actual.data
             actual = actual.next
-        return contador
 
     # Verificar si está vacía
     def is_empty(self):
         return self.head is None
 
-    # Mostrar la lista
-    def display(self):
-        actual = self.head
-        resultado = ""
-        while actual is not None:
-            resultado += f"[{actual.data}] -> "
-            actual = actual.next
-        resultado += "None"
-        print(resultado)
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la lista (en trozos a `stream`; `limite` recorta los extremos)
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "[{}] -> ", "... -> ", cierre="None\n")
+
+    # Validar una posición (admite negativas como las listas de Python)
+    def _normalizar(self, posicion):
+        if posicion < 0:
+            posicion += self.length
+        if not 0 <= posicion < self.length:
+            raise IndexError("Posición fuera de rango")
+        return posicion
+
+    # Dejar la lista vacía sin tocar los nodos (ahora son de otra lista)
+    def _vaciar(self):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.dedo = None
+
+    # Nodo en una posición válida: camina desde el dedo si está antes, si no
+    # desde head; el último se toma directo de tail. Deja el dedo ahí.
+    def _nodo_en(self, posicion):
+        if posicion == self.length - 1:
+            actual = self.tail
+        else:
+            if self.dedo is not None and self.dedo_pos <= posicion:
+                actual, desde = self.dedo, self.dedo_pos
+            else:
+                actual, desde = self.head, 0
+            for _ in range(posicion - desde):
+                actual = actual.next
+        self.dedo = actual
+        self.dedo_pos = posicion
+        return actual
 
 
 # --- Ejemplo de uso ---
-mi_lista = LinkedList()
-mi_lista.push_back(10)
-mi_lista.push_back(20)
-mi_lista.push_back(30)
-mi_lista.push_front(5)
-mi_lista.display()
-
-mi_lista.delete(20)
-mi_lista.display()
-
-print(f"Pop front: {mi_lista.pop_front()}")
-print(f"Pop back: {mi_lista.pop_back()}")
-mi_lista.display()
-print(f"Tamaño: {mi_lista.size()}")
+if __name__ == "__main__":
+    mi_lista = LinkedList()
+    mi_lista.push_back(10)
+    mi_lista.push_back(20)
+    mi_lista.push_back(30)
+    mi_lista.push_front(5)
+    mi_lista.display()
+
+    mi_lista.delete(20)
+    mi_lista.display()
+
+    print(f"Pop front: {mi_lista.pop_front()}")
+    print(f"Pop back: {mi_lista.pop_back()}")
+    mi_lista.display()
+    print(f"Tamaño: {mi_lista.size()}")
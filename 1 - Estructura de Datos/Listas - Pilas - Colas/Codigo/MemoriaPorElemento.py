@@ -0,0 +1,65 @@
+# Memoria por elemento de cada estructura
+# Llena cada estructura con N datos y mide con tracemalloc cuántos bytes
+# reservó en total, dividido por N. Los datos se crean antes de medir, así
+# solo cuenta lo que agrega la estructura (nodos, bloques, arreglos...).
+# Sirve para notar si un cambio (por ejemplo un campo más en el nodo)
+# hace crecer el costo por elemento.
+#   python MemoriaPorElemento.py [N]
+
+import sys
+import tracemalloc
+
+from ArrayDoublyLinkedList import ArrayDoublyLinkedList
+from DoublyLinkedList import DoublyLinkedList
+from LinkedList import LinkedList
+from Queue import Queue
+from RingBufferQueue import RingBufferQueue
+from SortedLinkedList import SortedLinkedList
+from Stack import Stack
+from UnrolledLinkedList import UnrolledLinkedList
+
+
+# Bytes por elemento que reserva `llenar(datos)` (incluye la estructura)
+def bytes_por_elemento(llenar, datos):
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        estructura = llenar(datos)
+        despues = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del estructura
+    return (despues - antes) / len(datos)
+
+
+# Llenar una estructura vacía llamando a `metodo` con cada dato
+def _agregar_uno_a_uno(clase, metodo):
+    def llenar(datos):
+        estructura = clase()
+        agregar = getattr(estructura, metodo)
+        for data in datos:
+            agregar(data)
+        return estructura
+    return llenar
+
+
+ESTRUCTURAS = {
+    "list (referencia)": list,
+    "LinkedList": _agregar_uno_a_uno(LinkedList, "push_back"),
+    "DoublyLinkedList": _agregar_uno_a_uno(DoublyLinkedList, "push_back"),
+    "DoublyLinkedList indexada": lambda datos: DoublyLinkedList.from_iterable(datos, indexed=True),
+    "ArrayDoublyLinkedList": _agregar_uno_a_uno(ArrayDoublyLinkedList, "push_back"),
+    "UnrolledLinkedList": _agregar_uno_a_uno(UnrolledLinkedList, "push_back"),
+    "SortedLinkedList": _agregar_uno_a_uno(SortedLinkedList, "insert"),
+    "Queue": _agregar_uno_a_uno(Queue, "enqueue"),
+    "Stack": _agregar_uno_a_uno(Stack, "push"),
+    "RingBufferQueue": _agregar_uno_a_uno(RingBufferQueue, "enqueue"),
+}
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    datos = list(range(n))
+    print(f"Bytes por elemento con {n} datos:")
+    for nombre, llenar in ESTRUCTURAS.items():
+        print(f"  {nombre:<28}{bytes_por_elemento(llenar, datos):8.1f}")
@@ -0,0 +1,119 @@
+# Lista Enlazada Persistente (Persistent Linked List)
+# Ninguna operación modifica la lista: cada cambio devuelve una versión nueva.
+# push_front y pop_front son O(1) y comparten todos los nodos con la versión
+# anterior. delete copia solo los nodos antes del dato eliminado y comparte
+# el resto. Insertar o quitar al final obligaría a copiar toda la lista, por
+# eso esta variante no tiene push_back ni pop_back.
+
+from Comun import mostrar, repr_acotado, visibles
+
+
+class Nodo:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+
+class PersistentLinkedList:
+    def __init__(self, head=None, length=0):
+        self.head = head
+        self.length = length
+
+    # Crear una lista a partir de cualquier iterable (mismo orden)
+    @classmethod
+    def from_iterable(cls, iterable):
+        datos = list(iterable)
+        head = None
+        for data in reversed(datos):
+            head = Nodo(data, head)
+        return cls(head, len(datos))
+
+    # Nueva versión con el dato al inicio
+    def push_front(self, data):
+        return PersistentLinkedList(Nodo(data, self.head), self.length + 1)
+
+    # Nueva versión sin el primero (el dato se lee antes con peek_front)
+    def pop_front(self):
+        if self.head is None:
+            return self
+        return PersistentLinkedList(self.head.next, self.length - 1)
+
+    # Ver el primero
+    def peek_front(self):
+        if self.head is None:
+            return None
+        return self.head.data
+
+    # Buscar dato, devuelve posición o -1
+    def search(self, data):
+        actual = self.head
+        posicion = 0
+        while actual is not None:
+            if actual.data == data:
+                return posicion
+            actual = actual.next
+            posicion += 1
+        return -1
+
+    # Nueva versión sin la primera aparición de un dato. Se copian los nodos
+    # anteriores a él; los posteriores se comparten.
+    def delete(self, data):
+        copiados = []
+        actual = self.head
+        while actual is not None and actual.data != data:
+            copiados.append(actual.data)
+            actual = actual.next
+        if actual is None:
+            return self
+        head = actual.next
+        for valor in reversed(copiados):
+            head = Nodo(valor, head)
+        return PersistentLinkedList(head, self.length - 1)
+
+    # Cantidad de elementos (cada versión guarda la suya, O(1))
+    def size(self):
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (head -> final) sin copiar la estructura
+    def __iter__(self):
+        actual = self.head
+        while actual is not None:
+            yield actual.data
+            actual = actual.next
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.head is None
+
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la lista (en trozos a `stream`; `limite` recorta los extremos)
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "[{}] -> ", "... -> ", cierre="None\n")
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    v1 = PersistentLinkedList.from_iterable([10, 20, 30])
+    v2 = v1.push_front(5)
+    v3 = v2.delete(20)
+    v1.display()
+    v2.display()
+    v3.display()
+    print(f"¿v3 comparte el nodo [30] con v1? {v3.head.next.next is v1.head.next.next}")
+
+    v4 = v3.pop_front()
+    print(f"Peek front v3: {v3.peek_front()}  |  Peek front v4: {v4.peek_front()}")
+    print(f"Tamaños: v1={v1.size()} v2={v2.size()} v3={v3.size()} v4={v4.size()}")
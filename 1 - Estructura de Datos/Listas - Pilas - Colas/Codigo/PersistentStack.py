@@ -0,0 +1,92 @@
+# Pila Persistente (Persistent Stack) — LIFO inmutable
+# Ninguna operación modifica la pila: push y pop devuelven una versión nueva
+# que comparte sus nodos con la anterior. Cada versión cuesta O(1) en tiempo
+# y un solo nodo de memoria, así guardar el historial (deshacer) es barato.
+
+from Comun import mostrar, repr_acotado, visibles
+
+
+class Nodo:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+
+class PersistentStack:
+    def __init__(self, top=None, length=0):
+        self.top = top
+        self.length = length
+
+    # Crear una pila a partir de cualquier iterable (el último queda en el top)
+    @classmethod
+    def from_iterable(cls, iterable):
+        top = None
+        length = 0
+        for data in iterable:
+            top = Nodo(data, top)
+            length += 1
+        return cls(top, length)
+
+    # Nueva versión con el dato en el top
+    def push(self, data):
+        return PersistentStack(Nodo(data, self.top), self.length + 1)
+
+    # Nueva versión sin el top (el dato se lee antes con peek)
+    def pop(self):
+        if self.top is None:
+            return self
+        return PersistentStack(self.top.next, self.length - 1)
+
+    # Ver el top sin eliminar
+    def peek(self):
+        if self.top is None:
+            return None
+        return self.top.data
+
+    # Cantidad de elementos (cada versión guarda la suya, O(1))
+    def size(self):
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (top -> fondo) sin copiar la estructura
+    def __iter__(self):
+        actual = self.top
+        while actual is not None:
+            yield actual.data
+            actual = actual.next
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.top is None
+
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la pila (top -> fondo), en trozos; `limite` recorta los extremos
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "  | {} |\n", "  | ... |\n", cierre="  +------+\n")
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    v0 = PersistentStack()
+    v1 = v0.push(10)
+    v2 = v1.push(20)
+    v3 = v2.push(30)
+    v3.display()
+
+    v4 = v3.pop()
+    print(f"Peek v3: {v3.peek()}  |  Peek v4: {v4.peek()}")
+    print(f"¿v4 comparte nodos con v2? {v4.top is v2.top}")
+    v4.display()
+    print(f"Tamaños: v1={v1.size()} v3={v3.size()} v4={v4.size()}")
@@ -1,21 +1,48 @@
 # Cola (Queue) — FIFO
 # Primero en entrar, primero en salir. Entra por rear, sale por front.
+# Con pool_size > 0 los nodos que salen se guardan (hasta ese tope) y se
+# reutilizan en los siguientes enqueue y enqueue_many, sin crear objetos nuevos.
+# ReservaDeNodos.py compara las reservas de memoria con y sin pool.
+
+from Comun import mostrar, repr_acotado, visibles
+
+
+# Recorrer una cadena de nodos ya separada de la cola
+def _recorrer(nodo):
+    while nodo is not None:
+        yield nodo.data
+        nodo = nodo.next
 
 
 class Nodo:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class Queue:
-    def __init__(self):
+    def __init__(self, pool_size=0):
         self.front = None
         self.rear = None
+        self.length = 0
+        # Reserva opcional de nodos sueltos para reutilizar (0 = desactivada)
+        self.pool_size = pool_size
+        self.libres = None
+        self.cantidad_libres = 0
+
+    # Crear una cola a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable, pool_size=0):
+        cola = cls(pool_size)
+        cola.enqueue_many(iterable)
+        return cola
 
     # Agregar al final (rear)
     def enqueue(self, data):
-        nuevo_nodo = Nodo(data)
+        nuevo_nodo = self._nuevo_nodo(data)
+        self.length += 1
         if self.rear is None:
             self.front = nuevo_nodo
             self.rear = nuevo_nodo
@@ -23,56 +50,150 @@ class Queue:
         self.rear.next = nuevo_nodo
         self.rear = nuevo_nodo
 
+    # Agregar varios al final en una sola pasada. Los nodos se arman en una
+    # cadena aparte y se enganchan al final recién al terminar: si el
+    # iterable falla la cola queda igual, y enqueue_many(self) no se persigue.
+    def enqueue_many(self, iterable):
+        primero = anterior = None
+        agregados = 0
+        for data in iterable:
+            nuevo_nodo = self._nuevo_nodo(data)
+            if anterior is None:
+                primero = nuevo_nodo
+            else:
+                anterior.next = nuevo_nodo
+            anterior = nuevo_nodo
+            agregados += 1
+        if agregados == 0:
+            return
+        if self.rear is None:
+            self.front = primero
+        else:
+            self.rear.next = primero
+        self.rear = anterior
+        self.length += agregados
+
     # Eliminar del frente (front)
     def dequeue(self):
         if self.front is None:
             return None
-        dato = self.front.data
-        self.front = self.front.next
+        nodo = self.front
+        dato = nodo.data
+        self.front = nodo.next
+        self.length -= 1
         if self.front is None:
             self.rear = None
+        if self.pool_size:
+            self._reciclar(nodo)
         return dato
 
+    # Eliminar hasta n datos del frente con una sola llamada. Devuelve una
+    # lista, o con lazy=True un generador sobre los nodos ya separados.
+    def dequeue_many(self, n, lazy=False):
+        cantidad = min(n, self.length)
+        if cantidad <= 0:
+            return iter(()) if lazy else []
+        if lazy:
+            primero = self.front
+            ultimo = primero
+            for _ in range(cantidad - 1):
+                ultimo = ultimo.next
+            self.front = ultimo.next
+            ultimo.next = None
+            datos = _recorrer(primero)
+        else:
+            datos = []
+            actual = self.front
+            for _ in range(cantidad):
+                datos.append(actual.data)
+                siguiente = actual.next
+                if self.pool_size:
+                    self._reciclar(actual)
+                actual = siguiente
+            self.front = actual
+        self.length -= cantidad
+        if self.front is None:
+            self.rear = None
+        return datos
+
+    # Vaciar la cola en O(1): se separa la cadena entera y se devuelve un
+    # iterador sobre sus datos (front -> rear)
+    def drain(self):
+        primero = self.front
+        self.front = None
+        self.rear = None
+        self.length = 0
+        return _recorrer(primero)
+
     # Ver el frente sin eliminar
     def peek(self):
         if self.front is None:
             return None
         return self.front.data
 
-    # Cantidad de elementos
+    # Cantidad de elementos (se lleva la cuenta, O(1))
     def size(self):
-        contador = 0
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (front -> rear) sin copiar la estructura
+    def __iter__(self):
         actual = self.front
         while actual is not None:
-            contador += 1
+            yield actual.data
             actual = actual.next
-        return contador
 
     # Verificar si está vacía
     def is_empty(self):
         return self.front is None
 
-    # Mostrar la cola (front -> rear)
-    def display(self):
-        actual = self.front
-        resultado = "front -> "
-        while actual is not None:
-            resultado += f"[{actual.data}] -> "
-            actual = actual.next
-        resultado += "rear"
-        print(resultado)
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la cola (front -> rear), en trozos; `limite` recorta los extremos
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "[{}] -> ", "... -> ", "front -> ", "rear\n")
+
+    # Tomar un nodo de la reserva, o crear uno si está vacía
+    def _nuevo_nodo(self, data):
+        nodo = self.libres
+        if nodo is None:
+            return Nodo(data)
+        self.libres = nodo.next
+        self.cantidad_libres -= 1
+        nodo.data = data
+        nodo.next = None
+        return nodo
+
+    # Devolver un nodo suelto a la reserva (sin dejar vivo su dato)
+    def _reciclar(self, nodo):
+        if self.cantidad_libres >= self.pool_size:
+            return
+        nodo.data = None
+        nodo.next = self.libres
+        self.libres = nodo
+        self.cantidad_libres += 1
 
 
 # --- Ejemplo de uso ---
-mi_cola = Queue()
-mi_cola.enqueue(10)
-mi_cola.enqueue(20)
-mi_cola.enqueue(30)
-mi_cola.enqueue(40)
-mi_cola.display()
-
-print(f"Dequeue: {mi_cola.dequeue()}")
-print(f"Dequeue: {mi_cola.dequeue()}")
-mi_cola.display()
-print(f"Peek: {mi_cola.peek()}")
-print(f"Tamaño: {mi_cola.size()}")
+if __name__ == "__main__":
+    mi_cola = Queue()
+    mi_cola.enqueue(10)
+    mi_cola.enqueue(20)
+    mi_cola.enqueue(30)
+    mi_cola.enqueue(40)
+    mi_cola.display()
+
+    print(f"Dequeue: {mi_cola.dequeue()}")
+    print(f"Dequeue: {mi_cola.dequeue()}")
+    mi_cola.display()
+    print(f"Peek: {mi_cola.peek()}")
+    print(f"Tamaño: {mi_cola.size()}")
@@ -0,0 +1,74 @@
+# Reserva de nodos (pool_size) en Queue y Stack
+# Mide en régimen estable, con ráfagas de datos que entran y después salen,
+# cuántos bytes nuevos reserva cada enqueue/push (con tracemalloc) y cuánto
+# tarda cada par entrar/salir, con y sin reserva. Sin reserva cada dato que
+# entra crea un nodo; con reserva se reutilizan los nodos de la ráfaga
+# anterior. Una ráfaga previa, sin medir, deja la reserva llena.
+#   python ReservaDeNodos.py [RAFAGAS] [TAM_RAFAGA]
+
+import sys
+import time
+import tracemalloc
+
+from Queue import Queue
+from Stack import Stack
+
+
+# Ejecutar `rafagas` ráfagas de `datos` y devolver los bytes nuevos que
+# reservó cada entrada (si medir_memoria) o los segundos que tardó
+def _rafagas(meter, sacar, datos, rafagas, medir_memoria):
+    for data in datos:
+        meter(data)
+    for _ in datos:
+        sacar()
+    reservado = 0
+    if medir_memoria:
+        tracemalloc.start()
+    try:
+        inicio = time.perf_counter()
+        for _ in range(rafagas):
+            if medir_memoria:
+                antes = tracemalloc.get_traced_memory()[0]
+            for data in datos:
+                meter(data)
+            if medir_memoria:
+                reservado += tracemalloc.get_traced_memory()[0] - antes
+            for _ in datos:
+                sacar()
+        segundos = time.perf_counter() - inicio
+    finally:
+        if medir_memoria:
+            tracemalloc.stop()
+    return reservado if medir_memoria else segundos
+
+
+# Bytes nuevos por entrada y nanosegundos por par entrar/salir
+def medir(clase, agregar, quitar, pool_size, rafagas, tam_rafaga):
+    datos = list(range(tam_rafaga))
+    resultados = []
+    for medir_memoria in (True, False):
+        estructura = clase(pool_size)
+        resultados.append(_rafagas(getattr(estructura, agregar),
+                                   getattr(estructura, quitar),
+                                   datos, rafagas, medir_memoria))
+    operaciones = rafagas * tam_rafaga
+    return resultados[0] / operaciones, resultados[1] / operaciones * 1e9
+
+
+ESTRUCTURAS = {
+    "Queue": (Queue, "enqueue", "dequeue"),
+    "Stack": (Stack, "push", "pop"),
+}
+
+
+if __name__ == "__main__":
+    rafagas = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    tam_rafaga = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    print(f"{rafagas} ráfagas de {tam_rafaga} datos:")
+    for nombre, (clase, agregar, quitar) in ESTRUCTURAS.items():
+        for pool_size in (0, tam_rafaga):
+            bytes_nuevos, nanos = medir(clase, agregar, quitar, pool_size,
+                                        rafagas, tam_rafaga)
+            print(f"  {nombre:<6} pool_size={pool_size:<4}"
+                  f"{bytes_nuevos:6.1f} B nuevos por {agregar:<9}"
+                  f"{nanos:8.1f} ns por {agregar}+{quitar}")
@@ -0,0 +1,132 @@
+# Cola sobre buffer circular (Ring Buffer Queue) — FIFO
+# Misma interfaz que Queue, pero los datos viven en una lista de Python
+# usada como anillo: `inicio` marca el frente y el final está `length`
+# lugares más adelante (dando la vuelta). No se crea un nodo por dato.
+# Si se llena, la capacidad se duplica; con shrink=True se reduce a la mitad
+# cuando queda ocupada a un cuarto. La capacidad es siempre potencia de 2
+# para dar la vuelta con una máscara en vez de %.
+
+from Comun import mostrar, repr_acotado, visibles
+
+CAPACIDAD_MINIMA = 8
+
+
+class RingBufferQueue:
+    def __init__(self, capacidad=CAPACIDAD_MINIMA, shrink=False):
+        tam = CAPACIDAD_MINIMA
+        while tam < capacidad:
+            tam *= 2
+        self.buffer = [None] * tam
+        self.mascara = tam - 1
+        self.inicio = 0
+        self.length = 0
+        self.shrink = shrink
+
+    # Crear una cola a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable, shrink=False):
+        cola = cls(shrink=shrink)
+        cola.enqueue_many(iterable)
+        return cola
+
+    # Agregar al final (rear)
+    def enqueue(self, data):
+        if self.length > self.mascara:
+            self._redimensionar(2 * len(self.buffer))
+        self.buffer[(self.inicio + self.length) & self.mascara] = data
+        self.length += 1
+
+    # Agregar varios al final
+    def enqueue_many(self, iterable):
+        for data in iterable:
+            self.enqueue(data)
+
+    # Eliminar del frente (front)
+    def dequeue(self):
+        if self.length == 0:
+            return None
+        dato = self.buffer[self.inicio]
+        self.buffer[self.inicio] = None       # No dejar vivo el dato
+        self.inicio = (self.inicio + 1) & self.mascara
+        self.length -= 1
+        if (self.shrink and len(self.buffer) > CAPACIDAD_MINIMA
+                and self.length <= len(self.buffer) // 4):
+            self._redimensionar(len(self.buffer) // 2)
+        return dato
+
+    # Ver el frente sin eliminar
+    def peek(self):
+        if self.length == 0:
+            return None
+        return self.buffer[self.inicio]
+
+    # Cantidad de elementos (se lleva la cuenta, O(1))
+    def size(self):
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (front -> rear) sin copiar la estructura
+    def __iter__(self):
+        buffer, mascara, inicio = self.buffer, self.mascara, self.inicio
+        for i in range(self.length):
+            yield buffer[(inicio + i) & mascara]
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.length == 0
+
+    # Representación acotada: nunca recorre más de LIMITE_REPR datos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la cola (front -> rear), en trozos; `limite` recorta los extremos
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "[{}] -> ", "... -> ", "front -> ", "rear\n")
+
+    # Copiar los datos en orden a un buffer nuevo de otro tamaño
+    def _redimensionar(self, tam):
+        nuevo = list(self)
+        nuevo.extend([None] * (tam - self.length))
+        self.buffer = nuevo
+        self.mascara = tam - 1
+        self.inicio = 0
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    import time
+
+    from Queue import Queue
+
+    mi_cola = RingBufferQueue()
+    mi_cola.enqueue(10)
+    mi_cola.enqueue(20)
+    mi_cola.enqueue(30)
+    mi_cola.enqueue(40)
+    mi_cola.display()
+
+    print(f"Dequeue: {mi_cola.dequeue()}")
+    print(f"Dequeue: {mi_cola.dequeue()}")
+    mi_cola.display()
+    print(f"Peek: {mi_cola.peek()}")
+    print(f"Tamaño: {mi_cola.size()}")
+
+    # Comparación con la cola de nodos: ráfagas de enqueue y luego dequeue
+    n = 200_000
+    for clase in (Queue, RingBufferQueue):
+        cola = clase()
+        inicio = time.perf_counter()
+        for _ in range(5):
+            for i in range(n):
+                cola.enqueue(i)
+            while cola.dequeue() is not None:
+                pass
+        segundos = time.perf_counter() - inicio
+        print(f"{clase.__name__}: {segundos:.3f} s para {5 * n} datos")
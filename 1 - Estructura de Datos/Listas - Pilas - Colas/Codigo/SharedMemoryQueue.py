@@ -0,0 +1,225 @@
+# Cola en memoria compartida entre procesos (Shared Memory Queue) — FIFO
+# Un anillo de casillas fijas dentro de un bloque de
+# multiprocessing.shared_memory. Cada casilla guarda un registro con prefijo
+# de longitud: [largo (4 bytes)][datos (hasta slot_size bytes)].
+# Los datos no se serializan con pickle ni pasan por un pipe: enqueue copia
+# los bytes una sola vez a la memoria compartida, y peek devuelve una vista
+# (memoryview) de la casilla sin copiar. Sirve para bytes, bytearray y
+# cualquier objeto con protocolo de buffer contiguo (por ejemplo arreglos de
+# NumPy: np.frombuffer(cola.peek(), dtype=...)).
+#
+# Encabezado: `inicio` y `fin` son contadores que solo crecen; la casilla es
+# el contador módulo la cantidad de casillas y size() = fin - inicio.
+# También guarda slots y slot_size: quien se conecta con create=False los lee
+# de ahí y no depende de los argumentos que pase.
+#   - Un productor y un consumidor (por defecto): no hace falta candado,
+#     cada lado escribe solo su contador y el productor publica `fin` recién
+#     después de escribir los datos.
+#   - multi_producer=True: los productores comparten un candado. El candado
+#     no vive en la memoria compartida: viaja con la cola al pasarla a un
+#     Process, o se pasa con `lock` a cada proceso que se conecta por nombre
+#     (create=False). Conectarse por nombre sin `lock` es un error, porque
+#     cada proceso tendría un candado propio que no excluye a los demás.
+# Se admite un solo consumidor.
+
+import struct
+from multiprocessing import Lock, shared_memory
+
+from Comun import CORTE, mostrar, visibles
+
+ENCABEZADO = 128          # inicio en 0 y fin en 64: líneas de caché separadas
+POS_INICIO = 0
+POS_GEOMETRIA = 8         # slots y slot_size (solo se escriben al crear)
+POS_FIN = 64
+LARGO = struct.Struct("<I")
+CONTADOR = struct.Struct("<Q")
+GEOMETRIA = struct.Struct("<QQ")
+
+
+class SharedMemoryQueue:
+    def __init__(self, name=None, slots=1024, slot_size=4096, create=True,
+                 multi_producer=False, lock=None):
+        if create:
+            self.shm = shared_memory.SharedMemory(
+                name=name, create=True,
+                size=ENCABEZADO + slots * (LARGO.size + slot_size))
+            CONTADOR.pack_into(self.shm.buf, POS_INICIO, 0)
+            CONTADOR.pack_into(self.shm.buf, POS_FIN, 0)
+            GEOMETRIA.pack_into(self.shm.buf, POS_GEOMETRIA, slots, slot_size)
+        else:
+            # Al conectarse se usa la geometría que guardó el creador
+            self.shm = shared_memory.SharedMemory(name=name)
+            slots, slot_size = GEOMETRIA.unpack_from(self.shm.buf, POS_GEOMETRIA)
+        self.slots = slots
+        self.slot_size = slot_size
+        self.tam_casilla = LARGO.size + slot_size
+        if lock is None and multi_producer:
+            if not create:
+                self.shm.close()
+                raise ValueError("Con multi_producer y create=False hay que pasar "
+                                 "el mismo lock que usa el creador")
+            lock = Lock()
+        self.lock = lock
+        self.creador = create
+
+    # Para pasar la cola a otro proceso: se vuelve a abrir por nombre
+    def __getstate__(self):
+        return (self.shm.name, self.lock)
+
+    def __setstate__(self, estado):
+        name, lock = estado
+        self.__init__(name, create=False, lock=lock)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    # Agregar al final; False si la cola está llena. Acepta cualquier objeto
+    # con protocolo de buffer de hasta slot_size bytes.
+    def enqueue(self, data):
+        vista = memoryview(data).cast("B")
+        if vista.nbytes > self.slot_size:
+            raise ValueError(f"El registro ocupa {vista.nbytes} bytes "
+                             f"y la casilla admite {self.slot_size}")
+        if self.lock is None:
+            return self._escribir(vista)
+        with self.lock:
+            return self._escribir(vista)
+
+    # Eliminar del frente y devolver sus bytes (None si está vacía)
+    def dequeue(self):
+        registro = self.peek()
+        if registro is None:
+            return None
+        dato = bytes(registro)
+        registro.release()
+        self._avanzar_inicio()
+        return dato
+
+    # Ver el frente sin copiar. La vista apunta a la casilla: hay que
+    # liberarla (release()) antes de hacer dequeue, porque después la casilla
+    # se reutiliza y la vista mostraría lo que escriba el productor.
+    def peek(self):
+        buf = self.shm.buf
+        inicio = CONTADOR.unpack_from(buf, POS_INICIO)[0]
+        if inicio == CONTADOR.unpack_from(buf, POS_FIN)[0]:
+            return None
+        posicion = self._posicion(inicio)
+        largo = LARGO.unpack_from(buf, posicion)[0]
+        desde = posicion + LARGO.size
+        return buf[desde:desde + largo]
+
+    # Cantidad de registros en la cola
+    def size(self):
+        buf = self.shm.buf
+        return CONTADOR.unpack_from(buf, POS_FIN)[0] - CONTADOR.unpack_from(buf, POS_INICIO)[0]
+
+    def __len__(self):
+        return self.size()
+
+    @property
+    def length(self):
+        return self.size()
+
+    # Recorrer los registros (front -> rear) copiando cada uno a bytes
+    def __iter__(self):
+        buf = self.shm.buf
+        inicio = CONTADOR.unpack_from(buf, POS_INICIO)[0]
+        fin = CONTADOR.unpack_from(buf, POS_FIN)[0]
+        for contador in range(inicio, fin):
+            posicion = self._posicion(contador)
+            largo = LARGO.unpack_from(buf, posicion)[0]
+            desde = posicion + LARGO.size
+            yield bytes(buf[desde:desde + largo])
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.size() == 0
+
+    # Verificar si está llena
+    def is_full(self):
+        return self.size() >= self.slots
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(name={self.name!r}, size={self.size()}, "
+                f"slots={self.slots}, slot_size={self.slot_size})")
+
+    # Mostrar la cola (front -> rear) con el largo de cada registro, en
+    # trozos; `limite` recorta los extremos
+    def display(self, stream=None, limite=None):
+        largos = (dato if dato is CORTE else len(dato)
+                  for dato in visibles(self, limite))
+        mostrar(stream, largos, "[{} B] -> ", "... -> ", "front -> ", "rear\n")
+
+    # Cerrar el acceso de este proceso (el creador además libera el bloque).
+    # Si queda una vista de peek() sin liberar, close() falla con BufferError
+    # pero el bloque se libera igual. Cerrar otra vez no hace nada.
+    def close(self):
+        try:
+            self.shm.close()
+        finally:
+            if self.creador:
+                self.creador = False
+                self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.close()
+
+    # Byte donde empieza la casilla de un contador
+    def _posicion(self, contador):
+        return ENCABEZADO + (contador % self.slots) * self.tam_casilla
+
+    # Escribir el registro y recién después publicar el nuevo fin
+    def _escribir(self, vista):
+        buf = self.shm.buf
+        fin = CONTADOR.unpack_from(buf, POS_FIN)[0]
+        if fin - CONTADOR.unpack_from(buf, POS_INICIO)[0] >= self.slots:
+            return False
+        posicion = self._posicion(fin)
+        LARGO.pack_into(buf, posicion, vista.nbytes)
+        desde = posicion + LARGO.size
+        buf[desde:desde + vista.nbytes] = vista
+        CONTADOR.pack_into(buf, POS_FIN, fin + 1)
+        return True
+
+    def _avanzar_inicio(self):
+        buf = self.shm.buf
+        inicio = CONTADOR.unpack_from(buf, POS_INICIO)[0]
+        CONTADOR.pack_into(buf, POS_INICIO, inicio + 1)
+
+
+# --- Ejemplo de uso ---
+def productor(cola, numero, cantidad):
+    for i in range(cantidad):
+        while not cola.enqueue(f"p{numero}-{i}".encode()):
+            pass                    # Llena: se reintenta
+    cola.shm.close()
+
+
+if __name__ == "__main__":
+    from multiprocessing import Process
+
+    with SharedMemoryQueue(slots=8, slot_size=64, multi_producer=True) as mi_cola:
+        procesos = [Process(target=productor, args=(mi_cola, n, 5)) for n in range(2)]
+        for proceso in procesos:
+            proceso.start()
+
+        recibidos = []
+        while len(recibidos) < 10:
+            dato = mi_cola.dequeue()
+            if dato is not None:
+                recibidos.append(dato.decode())
+        for proceso in procesos:
+            proceso.join()
+        print(f"Recibidos: {sorted(recibidos)}")
+
+        mi_cola.enqueue(b"hola")
+        mi_cola.enqueue(bytearray(range(10)))
+        mi_cola.display()
+        vista = mi_cola.peek()
+        print(f"Peek sin copiar: {bytes(vista)}")
+        vista.release()
+        print(f"Dequeue: {mi_cola.dequeue()}  |  Tamaño: {mi_cola.size()}")
@@ -0,0 +1,214 @@
+# Lista Enlazada Ordenada (Skip List)
+# Mantiene los datos ordenados. Cada nodo tiene una "torre" de punteros next:
+# el nivel 0 es una lista enlazada normal y los niveles superiores saltan
+# cada vez más nodos, así insertar, buscar y eliminar cuestan O(log n) esperado.
+# Cada puntero guarda también su ancho (cuántos nodos salta) para poder
+# devolver posiciones como LinkedList.search.
+
+import random
+
+from Comun import mostrar, repr_acotado, visibles
+
+MAX_NIVEL = 32
+
+
+class NodoSkip:
+    __slots__ = ("data", "next", "ancho")
+
+    def __init__(self, data, nivel):
+        self.data = data
+        self.next = [None] * nivel
+        self.ancho = [1] * nivel
+
+
+class SortedLinkedList:
+    def __init__(self, semilla=None):
+        self.head = NodoSkip(None, MAX_NIVEL)   # Centinela, no guarda datos
+        self.tail = None
+        self.nivel = 1
+        self.length = 0
+        self.azar = random.Random(semilla)
+
+    # Crear una lista ordenada a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable, semilla=None):
+        lista = cls(semilla)
+        for data in iterable:
+            lista.insert(data)
+        return lista
+
+    # Nivel aleatorio: cada nivel extra con probabilidad 1/2
+    def _nivel_aleatorio(self):
+        nivel = 1
+        while nivel < MAX_NIVEL and self.azar.random() < 0.5:
+            nivel += 1
+        return nivel
+
+    # Insertar en orden (los iguales quedan después de los existentes)
+    def insert(self, data):
+        anteriores = [None] * MAX_NIVEL
+        rangos = [0] * MAX_NIVEL
+        actual = self.head
+        posicion = 0
+        for i in range(self.nivel - 1, -1, -1):
+            while actual.next[i] is not None and actual.next[i].data <= data:
+                posicion += actual.ancho[i]
+                actual = actual.next[i]
+            anteriores[i] = actual
+            rangos[i] = posicion
+
+        nivel_nuevo = self._nivel_aleatorio()
+        if nivel_nuevo > self.nivel:
+            for i in range(self.nivel, nivel_nuevo):
+                anteriores[i] = self.head
+                rangos[i] = 0
+                self.head.ancho[i] = self.length + 1
+            self.nivel = nivel_nuevo
+
+        nuevo_nodo = NodoSkip(data, nivel_nuevo)
+        for i in range(nivel_nuevo):
+            anterior = anteriores[i]
+            saltados = rangos[0] - rangos[i]
+            nuevo_nodo.next[i] = anterior.next[i]
+            anterior.next[i] = nuevo_nodo
+            nuevo_nodo.ancho[i] = anterior.ancho[i] - saltados
+            anterior.ancho[i] = saltados + 1
+        for i in range(nivel_nuevo, self.nivel):
+            anteriores[i].ancho[i] += 1
+
+        if nuevo_nodo.next[0] is None:
+            self.tail = nuevo_nodo
+        self.length += 1
+
+    # Eliminar el primero
+    def pop_front(self):
+        if self.length == 0:
+            return None
+        nodo = self.head.next[0]
+        self._desenlazar(nodo, [self.head] * self.nivel)
+        return nodo.data
+
+    # Eliminar el último
+    def pop_back(self):
+        if self.length == 0:
+            return None
+        nodo = self.tail
+        anteriores = self._anteriores(lambda siguiente: siguiente is not nodo)
+        self._desenlazar(nodo, anteriores)
+        return nodo.data
+
+    # Ver el primero (el menor)
+    def peek_front(self):
+        if self.length == 0:
+            return None
+        return self.head.next[0].data
+
+    # Ver el último (el mayor)
+    def peek_back(self):
+        if self.tail is None:
+            return None
+        return self.tail.data
+
+    # Buscar dato, devuelve posición de la primera aparición o -1
+    def search(self, data):
+        actual = self.head
+        posicion = 0
+        for i in range(self.nivel - 1, -1, -1):
+            while actual.next[i] is not None and actual.next[i].data < data:
+                posicion += actual.ancho[i]
+                actual = actual.next[i]
+        candidato = actual.next[0]
+        if candidato is not None and candidato.data == data:
+            return posicion
+        return -1
+
+    # Eliminar primera aparición de un dato
+    def delete(self, data):
+        anteriores = self._anteriores(lambda siguiente: siguiente.data < data)
+        nodo = anteriores[0].next[0]
+        if nodo is None or nodo.data != data:
+            return
+        self._desenlazar(nodo, anteriores)
+
+    # Recorrer los datos en [desde, hasta) sin copiar la lista
+    def range(self, desde=None, hasta=None):
+        if desde is None:
+            actual = self.head.next[0]
+        else:
+            actual = self._anteriores(lambda siguiente: siguiente.data < desde)[0].next[0]
+        while actual is not None and (hasta is None or actual.data < hasta):
+            yield actual.data
+            actual = actual.next[0]
+
+    # Cantidad de elementos (se lleva la cuenta, O(1))
+    def size(self):
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos en orden sin copiar la estructura
+    def __iter__(self):
+        return self.range()
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.length == 0
+
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la lista con el mismo formato que LinkedList
+    # (en trozos a `stream`; `limite` recorta los extremos)
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "[{}] -> ", "... -> ", cierre="None\n")
+
+    # Nodo anterior en cada nivel: avanza mientras avanzar(siguiente) sea cierto
+    def _anteriores(self, avanzar):
+        anteriores = [None] * self.nivel
+        actual = self.head
+        for i in range(self.nivel - 1, -1, -1):
+            while actual.next[i] is not None and avanzar(actual.next[i]):
+                actual = actual.next[i]
+            anteriores[i] = actual
+        return anteriores
+
+    # Quitar un nodo conociendo su anterior en cada nivel
+    def _desenlazar(self, nodo, anteriores):
+        for i in range(self.nivel):
+            anterior = anteriores[i]
+            if anterior.next[i] is nodo:
+                anterior.ancho[i] += nodo.ancho[i] - 1
+                anterior.next[i] = nodo.next[i]
+            else:
+                anterior.ancho[i] -= 1
+        if nodo is self.tail:
+            self.tail = None if anteriores[0] is self.head else anteriores[0]
+        while self.nivel > 1 and self.head.next[self.nivel - 1] is None:
+            self.nivel -= 1
+        self.length -= 1
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    mi_lista = SortedLinkedList()
+    for valor in [30, 10, 50, 20, 40, 20]:
+        mi_lista.insert(valor)
+    mi_lista.display()
+
+    print(f"Buscar 40: posición {mi_lista.search(40)}")
+    print(f"Entre 20 y 45: {list(mi_lista.range(20, 45))}")
+
+    mi_lista.delete(20)
+    mi_lista.display()
+
+    print(f"Pop front: {mi_lista.pop_front()}")
+    print(f"Pop back: {mi_lista.pop_back()}")
+    mi_lista.display()
+    print(f"Tamaño: {mi_lista.size()}")
@@ -1,29 +1,65 @@
 # Pila (Stack) — LIFO
 # Último en entrar, primero en salir. Solo se opera desde el top.
+# Con pool_size > 0 los nodos que salen se guardan (hasta ese tope) y se
+# reutilizan en los siguientes push y push_many, sin crear objetos nuevos.
+# ReservaDeNodos.py compara las reservas de memoria con y sin pool.
+
+from Comun import mostrar, repr_acotado, visibles
 
 
 class Nodo:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class Stack:
-    def __init__(self):
+    def __init__(self, pool_size=0):
         self.top = None
+        self.length = 0
+        # Reserva opcional de nodos sueltos para reutilizar (0 = desactivada)
+        self.pool_size = pool_size
+        self.libres = None
+        self.cantidad_libres = 0
+
+    # Crear una pila a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable, pool_size=0):
+        pila = cls(pool_size)
+        pila.push_many(iterable)
+        return pila
 
     # Agregar al top
     def push(self, data):
-        nuevo_nodo = Nodo(data)
+        nuevo_nodo = self._nuevo_nodo(data)
         nuevo_nodo.next = self.top
         self.top = nuevo_nodo
+        self.length += 1
+
+    # Agregar varios en orden (el último queda en el top)
+    def push_many(self, iterable):
+        top = self.top
+        agregados = 0
+        for data in iterable:
+            nuevo_nodo = self._nuevo_nodo(data)
+            nuevo_nodo.next = top
+            top = nuevo_nodo
+            agregados += 1
+        self.top = top
+        self.length += agregados
 
     # Eliminar y devolver el top
     def pop(self):
         if self.top is None:
             return None
-        dato = self.top.data
-        self.top = self.top.next
+        nodo = self.top
+        dato = nodo.data
+        self.top = nodo.next
+        self.length -= 1
+        if self.pool_size:
+            self._reciclar(nodo)
         return dato
 
     # Ver el top sin eliminar
@@ -32,36 +68,67 @@ class Stack:
             return None
         return self.top.data
 
-    # Cantidad de elementos
+    # Cantidad de elementos (se lleva la cuenta, O(1))
     def size(self):
-        contador = 0
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (top -> fondo) sin copiar la estructura
+    def __iter__(self):
         actual = self.top
         while actual is not None:
-            contador += 1
+            yield actual.data
             actual = actual.next
-        return contador
 
     # Verificar si está vacía
     def is_empty(self):
         return self.top is None
 
-    # Mostrar la pila (top -> fondo)
-    def display(self):
-        actual = self.top
-        while actual is not None:
-            print(f"  | {actual.data} |")
-            actual = actual.next
-        print("  +------+")
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la pila (top -> fondo), en trozos; `limite` recorta los extremos
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "  | {} |\n", "  | ... |\n", cierre="  +------+\n")
+
+    # Tomar un nodo de la reserva, o crear uno si está vacía
+    def _nuevo_nodo(self, data):
+        nodo = self.libres
+        if nodo is None:
+            return Nodo(data)
+        self.libres = nodo.next
+        self.cantidad_libres -= 1
+        nodo.data = data
+        nodo.next = None
+        return nodo
+
+    # Devolver un nodo suelto a la reserva (sin dejar vivo su dato)
+    def _reciclar(self, nodo):
+        if self.cantidad_libres >= self.pool_size:
+            return
+        nodo.data = None
+        nodo.next = self.libres
+        self.libres = nodo
+        self.cantidad_libres += 1
 
 
 # --- Ejemplo de uso ---
-mi_pila = Stack()
-mi_pila.push(10)
-mi_pila.push(20)
-mi_pila.push(30)
-mi_pila.display()
-
-print(f"Pop: {mi_pila.pop()}")
-mi_pila.display()
-print(f"Peek: {mi_pila.peek()}")
-print(f"Tamaño: {mi_pila.size()}")
+if __name__ == "__main__":
+    mi_pila = Stack()
+    mi_pila.push(10)
+    mi_pila.push(20)
+    mi_pila.push(30)
+    mi_pila.display()
+
+    print(f"Pop: {mi_pila.pop()}")
+    mi_pila.display()
+    print(f"Peek: {mi_pila.peek()}")
+    print(f"Tamaño: {mi_pila.size()}")
@@ -0,0 +1,267 @@
+# Lista Enlazada Desenrollada (Unrolled Linked List)
+# Cada nodo guarda un bloque de hasta `capacidad` valores en vez de uno solo.
+# Menos nodos = menos memoria por elemento y recorridos más rápidos.
+# Un bloque lleno se divide en dos al insertar; un bloque que queda a menos
+# de la mitad se une (o pide prestado) con el siguiente al eliminar.
+
+from Comun import mostrar, repr_acotado, visibles
+
+
+class NodoBloque:
+    __slots__ = ("datos", "next")
+
+    def __init__(self):
+        self.datos = []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    def __init__(self, capacidad=64):
+        if capacidad < 2:
+            raise ValueError("La capacidad del bloque debe ser al menos 2")
+        self.capacidad = capacidad
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    # Crear una lista a partir de cualquier iterable
+    @classmethod
+    def from_iterable(cls, iterable, capacidad=64):
+        lista = cls(capacidad)
+        lista.extend(iterable)
+        return lista
+
+    # Insertar al inicio
+    def push_front(self, data):
+        if self.head is None or len(self.head.datos) >= self.capacidad:
+            nuevo_bloque = NodoBloque()
+            nuevo_bloque.next = self.head
+            self.head = nuevo_bloque
+            if self.tail is None:
+                self.tail = nuevo_bloque
+        self.head.datos.insert(0, data)
+        self.length += 1
+
+    # Insertar al final
+    def push_back(self, data):
+        if self.tail is None or len(self.tail.datos) >= self.capacidad:
+            nuevo_bloque = NodoBloque()
+            if self.tail is None:
+                self.head = nuevo_bloque
+            else:
+                self.tail.next = nuevo_bloque
+            self.tail = nuevo_bloque
+        self.tail.datos.append(data)
+        self.length += 1
+
+    # Insertar varios al final llenando bloques completos. Los bloques se arman
+    # aparte y se enganchan al terminar (si el iterable falla la lista queda
+    # igual); después se completa el último bloque que ya había.
+    def extend(self, iterable):
+        cabeza = bloque = None
+        agregados = 0
+        for data in iterable:
+            if bloque is None or len(bloque.datos) >= self.capacidad:
+                nuevo_bloque = NodoBloque()
+                if bloque is None:
+                    cabeza = nuevo_bloque
+                else:
+                    bloque.next = nuevo_bloque
+                bloque = nuevo_bloque
+            bloque.datos.append(data)
+            agregados += 1
+        if agregados == 0:
+            return
+        if self.tail is None:
+            self.head = cabeza
+        else:
+            lugar = self.capacidad - len(self.tail.datos)
+            self.tail.datos.extend(cabeza.datos[:lugar])
+            del cabeza.datos[:lugar]
+            if not cabeza.datos:
+                cabeza = cabeza.next
+            self.tail.next = cabeza
+        if cabeza is not None:
+            self.tail = bloque
+        self.length += agregados
+
+    # Insertar en una posición (como list.insert; divide el bloque si está lleno)
+    def insert(self, posicion, data):
+        if posicion < 0:
+            posicion = max(posicion + self.length, 0)
+        if posicion == 0 or self.head is None:
+            self.push_front(data)
+            return
+        if posicion >= self.length:
+            self.push_back(data)
+            return
+        bloque, indice = self._ubicar(posicion)
+        if len(bloque.datos) >= self.capacidad:
+            self._dividir(bloque)
+            if indice > len(bloque.datos):
+                indice -= len(bloque.datos)
+                bloque = bloque.next
+        bloque.datos.insert(indice, data)
+        self.length += 1
+
+    # Eliminar el primero
+    def pop_front(self):
+        if self.head is None:
+            return None
+        dato = self.head.datos.pop(0)
+        self.length -= 1
+        if not self.head.datos:
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+        return dato
+
+    # Eliminar el último
+    def pop_back(self):
+        if self.tail is None:
+            return None
+        dato = self.tail.datos.pop()
+        self.length -= 1
+        if not self.tail.datos:
+            # Se busca el bloque anterior (recorre bloques, no elementos)
+            if self.head is self.tail:
+                self.head = None
+                self.tail = None
+            else:
+                actual = self.head
+                while actual.next is not self.tail:
+                    actual = actual.next
+                actual.next = None
+                self.tail = actual
+        return dato
+
+    # Ver el primero
+    def peek_front(self):
+        if self.head is None:
+            return None
+        return self.head.datos[0]
+
+    # Ver el último
+    def peek_back(self):
+        if self.tail is None:
+            return None
+        return self.tail.datos[-1]
+
+    # Buscar dato, devuelve posición o -1
+    def search(self, data):
+        actual = self.head
+        posicion = 0
+        while actual is not None:
+            for indice, valor in enumerate(actual.datos):
+                if valor == data:
+                    return posicion + indice
+            posicion += len(actual.datos)
+            actual = actual.next
+        return -1
+
+    # Eliminar primera aparición de un dato
+    def delete(self, data):
+        anterior = None
+        actual = self.head
+        while actual is not None:
+            for indice, valor in enumerate(actual.datos):
+                if valor == data:
+                    del actual.datos[indice]
+                    self.length -= 1
+                    self._reequilibrar(anterior, actual)
+                    return
+            anterior = actual
+            actual = actual.next
+
+    # Cantidad de elementos (se lleva la cuenta, O(1))
+    def size(self):
+        return self.length
+
+    # Soporte para len() y bool()
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    # Recorrer los datos uno a uno (head -> tail) sin copiar la estructura
+    def __iter__(self):
+        actual = self.head
+        while actual is not None:
+            yield from actual.datos
+            actual = actual.next
+
+    # Verificar si está vacía
+    def is_empty(self):
+        return self.head is None
+
+    # Representación acotada: nunca recorre más de LIMITE_REPR nodos
+    def __repr__(self):
+        return repr_acotado(self)
+
+    # Mostrar la lista (en trozos a `stream`; `limite` recorta los extremos)
+    def display(self, stream=None, limite=None):
+        mostrar(stream, visibles(self, limite),
+                "[{}] -> ", "... -> ", cierre="None\n")
+
+    # Bloque y posición dentro del bloque para una posición global
+    def _ubicar(self, posicion):
+        actual = self.head
+        while posicion > len(actual.datos):
+            posicion -= len(actual.datos)
+            actual = actual.next
+        return actual, posicion
+
+    # Dividir un bloque lleno en dos mitades
+    def _dividir(self, bloque):
+        mitad = len(bloque.datos) // 2
+        nuevo_bloque = NodoBloque()
+        nuevo_bloque.datos = bloque.datos[mitad:]
+        del bloque.datos[mitad:]
+        nuevo_bloque.next = bloque.next
+        bloque.next = nuevo_bloque
+        if bloque is self.tail:
+            self.tail = nuevo_bloque
+
+    # Unir o pedir prestado al siguiente si el bloque quedó por debajo de la mitad
+    def _reequilibrar(self, anterior, bloque):
+        if not bloque.datos:
+            if anterior is None:
+                self.head = bloque.next
+            else:
+                anterior.next = bloque.next
+            if bloque is self.tail:
+                self.tail = anterior
+            return
+        minimo = self.capacidad // 2
+        siguiente = bloque.next
+        if len(bloque.datos) >= minimo or siguiente is None:
+            return
+        if len(bloque.datos) + len(siguiente.datos) <= self.capacidad:
+            bloque.datos.extend(siguiente.datos)
+            bloque.next = siguiente.next
+            if siguiente is self.tail:
+                self.tail = bloque
+        else:
+            faltan = minimo - len(bloque.datos)
+            bloque.datos.extend(siguiente.datos[:faltan])
+            del siguiente.datos[:faltan]
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    mi_lista = UnrolledLinkedList(capacidad=4)
+    for valor in range(10, 100, 10):
+        mi_lista.push_back(valor)
+    mi_lista.push_front(5)
+    mi_lista.display()
+
+    mi_lista.insert(3, 25)
+    mi_lista.delete(20)
+    mi_lista.display()
+    print(f"Buscar 70: posición {mi_lista.search(70)}")
+
+    print(f"Pop front: {mi_lista.pop_front()}")
+    print(f"Pop back: {mi_lista.pop_back()}")
+    mi_lista.display()
+    print(f"Tamaño: {mi_lista.size()}")